@@ -1,30 +1,109 @@
+import hashlib
 import json
 import logging
+import mmap
+import multiprocessing
 import os
-import sys
-import tempfile
+import re
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import closing, suppress
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple
-
-BASE_DIR = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(BASE_DIR))
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from src.core.factory import AgentFactory
 from src.core.indexer import Indexer
+from src.core.storage import SCHEMA_VERSION
 from src.core.validator import DatabaseValidator
 
+if TYPE_CHECKING:
+    from agno.agent import Agent
+
 logger = logging.getLogger(__name__)
 
+BASE_DIR = Path(__file__).resolve().parent.parent
 RESULTS_DIR = BASE_DIR / "results"
 RESULTS_DIR.mkdir(exist_ok=True)
 
+# Matches the leading "index" and trailing "is_correct" fields of a saved record
+_RECORD_RE = re.compile(rb'\{"index":\s*(\d+),.*?"is_correct":\s*(true|false)')
+
+
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """Serializes one JSONL record, newline included."""
+    if orjson:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+_loads = orjson.loads if orjson else json.loads
+
+# Write buffer for the results JSONL
+_WRITE_BUFFER_SIZE = 8 << 20
+
+
+# Engine copy for the current worker process, installed once by _init_worker
+_worker_engine: Optional["BenchmarkEngine"] = None
+
+
+def _init_worker(log_level: int, engine: "BenchmarkEngine") -> None:
+    """Configures logging in spawned benchmark worker processes and keeps their engine copy."""
+    global _worker_engine
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s [%(levelname)s] %(processName)s %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    _worker_engine = engine
+
+
+def _worker_process_one(
+    i: int, item: Dict[str, Any], db_filename: Optional[str]
+) -> Optional[Tuple[str, str, bool]]:
+    return _worker_engine._process_one(i, item, db_filename)
+
+
+def _worker_prepare(i: int, item: Dict[str, Any], db_filename: str) -> Optional[str]:
+    return _worker_engine._prepare_item_db(i, item, db_filename)
+
+
+def _worker_answer(i: int, item: Dict[str, Any], item_db_path: str) -> Tuple[str, str, bool]:
+    return _worker_engine._answer_item(i, item, item_db_path)
+
 
 class BenchmarkLogic(ABC):
     """Defines the custom logic for a specific dataset (LongBench, Oolong, etc)."""
 
+    # Strategies are stateless; no per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
-    def load_data(self, subset: str, limit: int = None) -> List[Dict[str, Any]]:
+    def load_data(self, subset: str, limit: int = None) -> Sequence[Dict[str, Any]]:
+        """Returns an indexable collection of items; it need not be a materialized list."""
         pass
 
     @abstractmethod
@@ -49,12 +128,31 @@ class BenchmarkEngine:
         strategy: BenchmarkLogic,
         max_chunk_tokens: int = 50000,
         db_output_dir: str = None,
+        flush_every: int = 32,
+        workers: int = 1,
     ):
         self.name = name
         self.subset = subset
         self.strategy = strategy
         self.output_file = RESULTS_DIR / f"{name}_{subset}_results.jsonl"
         self.max_chunk_tokens = max_chunk_tokens
+        self.flush_every = max(1, flush_every)
+        self.workers = max(1, workers)
+
+        # Results handle is opened once per run() and flushed every `flush_every` records
+        self._out: Optional[BinaryIO] = None
+        self._pending_writes = 0
+
+        # Built on first use and retargeted per item instead of rebuilt
+        self._indexer: Optional[Indexer] = None
+        self._agent: Optional["Agent"] = None
+        # Set when a serial run ends, to stop the ingestion being prefetched
+        self._ingest_stop: Optional[threading.Event] = None
+
+        # DB filenames present in db_storage_dir, listed once per run()
+        self._existing_dbs: Set[str] = set()
+        # DB filenames already ingested or validated during the current run()
+        self._prepared_dbs: Set[str] = set()
 
         if db_output_dir:
             self.db_storage_dir = Path(db_output_dir)
@@ -62,58 +160,84 @@ class BenchmarkEngine:
             self.db_storage_dir = BASE_DIR / "benchmark_dbs" / name / subset
 
         self.db_storage_dir.mkdir(parents=True, exist_ok=True)
+        # Per-item DB paths are built by concatenation to keep Path objects off the hot loop
+        self._db_dir_str = str(self.db_storage_dir) + os.sep
 
-    def _ingest_context(self, context: str, db_path: Path) -> None:
+    def _ingest_context(self, context: str, db_path: str) -> None:
         """Ingests context into a temporary DB."""
-        indexer = Indexer(db_path=str(db_path), max_chunk_tokens=self.max_chunk_tokens)
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", delete=False, suffix=".txt", encoding="utf-8"
-        ) as tmp:
-            tmp.write(context)
-            tmp_path = tmp.name
-
-        try:
-            indexer.ingest_file(tmp_path)
-        finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-
-    def _get_processed_indices(self) -> Set[int]:
-        """Returns set of already processed item indices."""
+        if self._indexer is None:
+            self._indexer = Indexer(db_path=db_path, max_chunk_tokens=self.max_chunk_tokens)
+        else:
+            self._indexer.retarget(db_path)
+        self._indexer.ingest_text(
+            context, source_name=os.path.basename(db_path), stop=self._ingest_stop
+        )
+        if self._ingest_stop is not None and self._ingest_stop.is_set():
+            # Drop the partial DB so the next run ingests this context again
+            for suffix in ("", "-wal", "-shm"):
+                with suppress(FileNotFoundError):
+                    os.remove(db_path + suffix)
+            raise CancelledError(f"Ingestion into {db_path} was stopped")
+
+    def _scan_results(self) -> Tuple[Set[int], int, int]:
+        """
+        Single pass over the memory-mapped results file.
+        Returns (processed_indices, correct_count, total_count).
+        """
         processed: Set[int] = set()
-        if not self.output_file.exists():
-            return processed
-
-        with open(self.output_file, "r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    processed.add(record["index"])
-                except (json.JSONDecodeError, KeyError):
-                    continue
-
-        return processed
-
-    def _load_existing_stats(self) -> Tuple[int, int]:
-        """Returns (correct_count, total_count) from existing results."""
         correct_count = 0
         total_count = 0
 
-        if not self.output_file.exists():
-            return correct_count, total_count
-
-        with open(self.output_file, "r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    if record.get("is_correct"):
-                        correct_count += 1
-                    total_count += 1
-                except json.JSONDecodeError:
+        try:
+            if self.output_file.stat().st_size == 0:
+                return processed, correct_count, total_count
+        except FileNotFoundError:
+            return processed, correct_count, total_count
+
+        # Local bindings keep attribute lookups out of the per-line loop
+        match_record = _RECORD_RE.match
+        loads = _loads
+        add = processed.add
+
+        with open(self.output_file, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            find = mm.find
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = find(b"\n", start)
+                if end < 0:
+                    end = size
+                line = mm[start:end]
+                start = end + 1
+
+                if not line.strip():
                     continue
 
-        return correct_count, total_count
+                # Fast path: records are written with "index" first, so the two
+                # fields we need can be pulled out without decoding the response.
+                match = match_record(line)
+                if match:
+                    index = int(match.group(1))
+                    is_correct = match.group(2) == b"true"
+                else:
+                    try:
+                        record = loads(line)
+                        index = record["index"]
+                        is_correct = bool(record.get("is_correct"))
+                    except (json.JSONDecodeError, KeyError):
+                        continue
+
+                add(index)
+                if is_correct:
+                    correct_count += 1
+                total_count += 1
+
+        return processed, correct_count, total_count
 
     def _save_result(
         self,
@@ -133,13 +257,287 @@ class BenchmarkEngine:
             "expected_answer": expected,
             "is_correct": is_correct,
         }
-        with open(self.output_file, "a", encoding="utf-8") as f:
-            f.write("\n"+ json.dumps(record) + "\n")
+        self._out.write(_dumps_line(record))
+        self._pending_writes += 1
+        if self._pending_writes >= self.flush_every:
+            self._out.flush()
+            self._pending_writes = 0
+
+    @staticmethod
+    def _sentinel_path(item_db_path: str) -> str:
+        return item_db_path + ".ok"
+
+    def _is_validated(self, item_db_path: str) -> bool:
+        """True if the sentinel matches the current schema version and DB mtime."""
+        try:
+            with open(self._sentinel_path(item_db_path)) as f:
+                version, mtime_ns = f.read().split()
+            return (
+                int(version) == SCHEMA_VERSION
+                and int(mtime_ns) == os.stat(item_db_path).st_mtime_ns
+            )
+        except (OSError, ValueError):
+            return False
+
+    def _mark_validated(self, item_db_path: str) -> None:
+        with open(self._sentinel_path(item_db_path), "w") as f:
+            f.write(f"{SCHEMA_VERSION}\n{os.stat(item_db_path).st_mtime_ns}\n")
+
+    def _validate_existing_db(self, item_db_path: str) -> None:
+        """Validates an existing DB and repairs it in place if issues are found."""
+        if self._is_validated(item_db_path):
+            logger.info("Found existing DB at %s, skipping validation (cached)", item_db_path)
+            return
+
+        logger.info("Found existing DB at %s, validating...", item_db_path)
+        validator = DatabaseValidator(item_db_path)
+        issues = validator.validate()
+
+        # Count issues properly (incomplete_summaries is a dict, not a list)
+        missing_level_0 = len(issues["incomplete_summaries"]["missing_level_0"])
+        orphan_summaries = len(issues["incomplete_summaries"]["orphan_summary_ids"])
+        total_issues = (
+            len(issues["provider_error"])
+            + len(issues["think_blocks"])
+            + len(issues["markdown_prefix"])
+            + missing_level_0
+            + orphan_summaries
+        )
+
+        if total_issues > 0:
+            logger.info(
+                "Found %d issues: %d provider_error, %d think_blocks, %d markdown_prefix, %d missing_level_0, %d orphan_summaries",
+                total_issues,
+                len(issues["provider_error"]),
+                len(issues["think_blocks"]),
+                len(issues["markdown_prefix"]),
+                missing_level_0,
+                orphan_summaries,
+            )
+            stats = validator.repair(dry_run=False, issues=issues)
+            logger.info(
+                "Repair complete: cleaned=%d, regenerated=%d, failed=%d, generated_level_0=%d, generated_hierarchy=%d",
+                stats["cleaned"],
+                stats["regenerated"],
+                stats["failed"],
+                stats.get("generated_level_0", 0),
+                stats.get("generated_hierarchy", 0),
+            )
+            if stats["failed"] == 0:
+                self._mark_validated(item_db_path)
+        else:
+            logger.info("Database validation passed.")
+            self._mark_validated(item_db_path)
+
+    def _db_filename(self, i: int, context: str) -> str:
+        """
+        DBs are keyed by a hash of the context so items over the same document
+        share one index. Legacy per-item q_{i}.db files are still used if present.
+        """
+        legacy = f"q_{i}.db"
+        if legacy in self._existing_dbs:
+            return legacy
+        digest = hashlib.sha256(context.encode("utf-8")).hexdigest()[:16]
+        return f"ctx_{digest}.db"
+
+    def _item_db_filename(self, i: int, item: Dict[str, Any]) -> Optional[str]:
+        """DB filename for item i, or None if its context is empty. Hashes the context once."""
+        context = self.strategy.get_context(item)
+        return self._db_filename(i, context) if context else None
+
+    def _prepare_item_db(
+        self, i: int, item: Dict[str, Any], db_filename: Optional[str]
+    ) -> Optional[str]:
+        """
+        Makes sure item i has a usable DB: validates/repairs an existing one or
+        ingests the context into a new one. db_filename comes from
+        _item_db_filename; returns None for empty contexts.
+        """
+        if db_filename is None:
+            logger.warning("Skipping empty context for item %d", i)
+            return None
+
+        item_db_path = self._db_dir_str + db_filename
+
+        if db_filename in self._prepared_dbs:
+            logger.info("Reusing DB %s for item %d", db_filename, i)
+            return item_db_path
+
+        if db_filename in self._existing_dbs:
+            self._validate_existing_db(item_db_path)
+        else:
+            context = self.strategy.get_context(item)
+            logger.info("Ingesting %d chars for item %d...", len(context), i)
+            self._ingest_context(context, item_db_path)
+            self._existing_dbs.add(db_filename)
+
+        self._prepared_dbs.add(db_filename)
+        return item_db_path
+
+    def _answer_item(
+        self, i: int, item: Dict[str, Any], item_db_path: str
+    ) -> Tuple[str, str, bool]:
+        """Runs the agent against a prepared DB. Returns (response, expected, is_correct)."""
+        # Unique session ID per item; the agent itself is reused across items
+        session_id = f"bench_{self.name}_{self.subset}_{i}"
+        if self._agent is None:
+            self._agent = AgentFactory.create_agent(
+                "rlm-agent",
+                content_db_path=item_db_path,
+                session_id=session_id,
+            )
+        else:
+            AgentFactory.rebind(
+                self._agent,
+                content_db_path=item_db_path,
+                session_id=session_id,
+            )
+        agent = self._agent
+
+        prompt = self.strategy.create_prompt(item)
+        logger.info("Asking Agent...")
+
+        response_obj = agent.run(prompt)
+        response_text = str(response_obj.content)
+        if logger.isEnabledFor(logging.INFO):
+            # Full text is kept for the results file; the log line is capped
+            logger.info(
+                "Agent response (%d chars): %.512s", len(response_text), response_text
+            )
+
+        is_correct, expected = self.strategy.evaluate(response_text, item)
+
+        status = "CORRECT" if is_correct else f"WRONG (Exp: {expected})"
+        logger.info("[%s] Item %d result: %s", self.name, i, status)
+
+        return response_text, expected, is_correct
+
+    def _process_one(
+        self, i: int, item: Dict[str, Any], db_filename: Optional[str]
+    ) -> Optional[Tuple[str, str, bool]]:
+        """Full per-item workflow (prepare DB -> agent -> evaluate); used by pool workers."""
+        item_db_path = self._prepare_item_db(i, item, db_filename)
+        if item_db_path is None:
+            return None
+        return self._answer_item(i, item, item_db_path)
+
+    def _iter_serial(
+        self, data: Sequence[Dict[str, Any]], pending: List[int]
+    ) -> Iterator[Tuple[int, Optional[Tuple[str, str, bool]]]]:
+        """Processes items in order, ingesting item N+1 while the agent answers item N."""
+        prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bench-prefetch")
+        self._ingest_stop = threading.Event()
+        prefetched: Dict[int, Future] = {}
+        # Item and DB filename looked up one iteration early, so each context is hashed once
+        upcoming: Optional[Tuple[int, Dict[str, Any], Optional[str]]] = None
+
+        try:
+            for pos, i in enumerate(pending):
+                if upcoming is not None and upcoming[0] == i:
+                    _, item, db_filename = upcoming
+                else:
+                    item = data[i]
+                    db_filename = self._item_db_filename(i, item)
+                logger.info("[%s] Item %d (%d/%d)", self.name, i, pos + 1, len(pending))
+
+                future = prefetched.pop(i, None)
+                item_db_path = (
+                    future.result() if future else self._prepare_item_db(i, item, db_filename)
+                )
+
+                # Existing DBs are validated inline; only fresh ingestion is prefetched
+                upcoming = None
+                if pos + 1 < len(pending):
+                    next_i = pending[pos + 1]
+                    next_item = data[next_i]
+                    next_db = self._item_db_filename(next_i, next_item)
+                    upcoming = (next_i, next_item, next_db)
+                    if next_db is not None and next_db not in self._existing_dbs:
+                        prefetched[next_i] = prefetcher.submit(
+                            self._prepare_item_db, next_i, next_item, next_db
+                        )
+
+                if item_db_path is None:
+                    yield i, None
+                    continue
+
+                yield i, self._answer_item(i, item, item_db_path)
+        finally:
+            # cancel_futures can't interrupt an ingestion that is already running (e.g.
+            # after an agent error or Ctrl-C), so ask it to stop at its next LLM call
+            self._ingest_stop.set()
+            prefetcher.shutdown(wait=True, cancel_futures=True)
+            self._ingest_stop = None
+
+    def _iter_parallel(
+        self, data: Sequence[Dict[str, Any]], pending: List[int]
+    ) -> Iterator[Tuple[int, Optional[Tuple[str, str, bool]]]]:
+        """Fans items out to worker processes; results stream back in completion order."""
+        logger.info("Processing %d items with %d worker processes", len(pending), self.workers)
+        # The engine is pickled once per worker process; tasks carry only the item
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(logging.getLogger().getEffectiveLevel(), self),
+        )
+
+        # Items sharing a context share a DB: the first one prepares it on its own,
+        # and it and the rest are answered once it is ready, so it is never
+        # ingested twice.
+        ready: List[int] = []
+        held: Dict[str, List[int]] = {}
+        db_for: Dict[int, Optional[str]] = {}
+        for i in pending:
+            db_filename = self._item_db_filename(i, data[i])
+            db_for[i] = db_filename
+            if db_filename is not None and db_filename in held:
+                held[db_filename].append(i)
+            else:
+                if db_filename is not None:
+                    held[db_filename] = []
+                ready.append(i)
+
+        try:
+            # Future -> (item index, True if it only prepares the item's DB)
+            futures: Dict[Future, Tuple[int, bool]] = {}
+            for i in ready:
+                db_filename = db_for[i]
+                if db_filename is not None and held[db_filename]:
+                    futures[pool.submit(_worker_prepare, i, data[i], db_filename)] = (i, True)
+                else:
+                    futures[pool.submit(_worker_process_one, i, data[i], db_filename)] = (i, False)
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, prepare_only = futures.pop(future)
+                    result = future.result()
+
+                    if prepare_only:
+                        item_db_path = result
+                        for j in (i, *held.pop(db_for[i])):
+                            futures[pool.submit(_worker_answer, j, data[j], item_db_path)] = (j, False)
+                        continue
+
+                    yield i, result
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Each worker process gets one copy of the engine (via the pool initializer)
+        # without the parent's results handle; it builds its own indexer and agent
+        # on first use and reuses them for every item it handles
+        state = self.__dict__.copy()
+        state["_out"] = None
+        state["_indexer"] = None
+        state["_agent"] = None
+        state["_ingest_stop"] = None
+        return state
 
     def run(self, limit: int = None, questions: List[int] = None) -> None:
         data = self.strategy.load_data(self.subset, limit)
-        processed = self._get_processed_indices()
-        correct_count, total_processed_count = self._load_existing_stats()
+        processed, correct_count, total_processed_count = self._scan_results()
 
         # Convert questions to a set for O(1) lookup (already 0-based from CLI parsing)
         questions_set = set(questions) if questions else None
@@ -161,102 +559,43 @@ class BenchmarkEngine:
             len(processed),
         )
 
-        for i, item in enumerate(data):
-            # Skip if not in specified questions list
-            if questions_set is not None and i not in questions_set:
-                continue
-            # Skip if already processed
-            if i in processed:
-                continue
+        indices = sorted(questions_set) if questions_set is not None else range(len(data))
+        pending = [i for i in indices if i not in processed]
 
-            logger.info(
-                "[%s] Item %d (Total Done: %d)",
-                self.name,
-                i,
-                total_processed_count,
-            )
+        with os.scandir(self.db_storage_dir) as entries:
+            self._existing_dbs = {e.name for e in entries if e.name.endswith(".db")}
+        self._prepared_dbs = set()
 
-            db_filename = f"q_{i}.db"
-            item_db_path = self.db_storage_dir / db_filename
+        if self.workers > 1 and len(pending) > 1:
+            results = self._iter_parallel(data, pending)
+        else:
+            results = self._iter_serial(data, pending)
 
-            context = self.strategy.get_context(item)
-            if not context:
-                logger.warning("Skipping empty context for item %d", i)
-                continue
-
-            # Validate and repair existing DB, or ingest new one
-            if item_db_path.exists():
-                logger.info("Found existing DB at %s, validating...", item_db_path)
-                validator = DatabaseValidator(str(item_db_path))
-                issues = validator.validate()
-
-                # Count issues properly (incomplete_summaries is a dict, not a list)
-                missing_level_0 = len(issues["incomplete_summaries"]["missing_level_0"])
-                orphan_summaries = len(issues["incomplete_summaries"]["orphan_summary_ids"])
-                total_issues = (
-                    len(issues["provider_error"])
-                    + len(issues["think_blocks"])
-                    + len(issues["markdown_prefix"])
-                    + missing_level_0
-                    + orphan_summaries
-                )
+        # Results are always written from this process, so the JSONL has a single writer
+        # Binary BufferedWriter: no text-layer encoding, flushed every `flush_every` records
+        self._out = open(self.output_file, "ab", buffering=_WRITE_BUFFER_SIZE)
+        self._pending_writes = 0
+        try:
+            with closing(results):
+                for i, result in results:
+                    if result is None:
+                        continue
+                    response_text, expected, is_correct = result
 
-                if total_issues > 0:
-                    logger.info(
-                        "Found %d issues: %d provider_error, %d think_blocks, %d markdown_prefix, %d missing_level_0, %d orphan_summaries",
-                        total_issues,
-                        len(issues["provider_error"]),
-                        len(issues["think_blocks"]),
-                        len(issues["markdown_prefix"]),
-                        missing_level_0,
-                        orphan_summaries,
-                    )
-                    stats = validator.repair(dry_run=False, issues=issues)
-                    logger.info(
-                        "Repair complete: cleaned=%d, regenerated=%d, failed=%d, generated_level_0=%d, generated_hierarchy=%d",
-                        stats["cleaned"],
-                        stats["regenerated"],
-                        stats["failed"],
-                        stats.get("generated_level_0", 0),
-                        stats.get("generated_hierarchy", 0),
+                    if is_correct:
+                        correct_count += 1
+                    total_processed_count += 1
+
+                    self._save_result(
+                        i,
+                        data[i].get("question", ""),
+                        response_text,
+                        expected,
+                        is_correct,
                     )
-                else:
-                    logger.info("Database validation passed.")
-            else:
-                logger.info("Ingesting %d chars...", len(context))
-                self._ingest_context(context, item_db_path)
-
-            # Create agent with unique session ID
-            session_id = f"bench_{self.name}_{self.subset}_{i}"
-            agent = AgentFactory.create_agent(
-                "rlm-agent",
-                content_db_path=str(item_db_path),
-                session_id=session_id,
-            )
-
-            prompt = self.strategy.create_prompt(item)
-            logger.info("Asking Agent...")
-
-            response_obj = agent.run(prompt)
-            response_text = str(response_obj.content)
-            logger.info("Agent response: %s", response_text)
-
-            is_correct, expected = self.strategy.evaluate(response_text, item)
-
-            status = "CORRECT" if is_correct else f"WRONG (Exp: {expected})"
-            logger.info("Result: %s", status)
-
-            if is_correct:
-                correct_count += 1
-            total_processed_count += 1
-
-            self._save_result(
-                i,
-                item.get("question", ""),
-                response_text,
-                expected,
-                is_correct,
-            )
+        finally:
+            self._out.close()
+            self._out = None
 
         logger.info("Benchmarking Complete")
         if total_processed_count > 0:
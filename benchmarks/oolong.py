@@ -1,14 +1,123 @@
 import ast
+import functools
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple
 
-from datasets import load_dataset
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from base import BASE_DIR, BenchmarkLogic
+from benchmarks.base import BASE_DIR, BenchmarkLogic
+
+_LABEL_RE = re.compile(r"Label:\s*([a-zA-Z]+)", re.IGNORECASE)
+_NONWORD_RE = re.compile(r"[^\w]")
+# Only the columns the benchmark reads are mapped
+_COLUMNS = ["context_window_text", "question", "answer"]
+# Recently handed-out rows kept alive so repeated data[i] lookups (context, DB name,
+# prompt, evaluation) share one decoded row; small so contexts don't pile up
+_ROW_CACHE_SIZE = 4
+
+
+@functools.lru_cache(maxsize=8)
+def _load_parquet(path_str: str) -> pa.Table:
+    """Memory-maps a parquet subset once per process; Arrow tables are immutable so sharing is safe."""
+    return pq.read_table(path_str, columns=_COLUMNS, memory_map=True)
+
+
+class _LazyRow(Mapping[str, Any]):
+    """
+    One table row whose columns are decoded on first access, so reading the
+    question never pulls in the multi-megabyte context. Pickles as a plain dict.
+    """
+
+    __slots__ = ("_table", "_index", "_cache")
+
+    def __init__(self, table: pa.Table, index: int):
+        self._table = table
+        self._index = index
+        self._cache: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        if key not in self._table.column_names:
+            raise KeyError(key)
+        value = self._cache[key] = self._table.column(key)[self._index].as_py()
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.column_names)
+
+    def __len__(self) -> int:
+        return self._table.num_columns
+
+    def __reduce__(self):
+        # Worker processes get the decoded values, not the whole mapped table
+        return (dict, (dict(self.items()),))
+
+
+class _TableRows(Sequence[Mapping[str, Any]]):
+    """Read-only row view over an Arrow table; rows decode lazily per column."""
+
+    __slots__ = ("_table", "_rows")
+
+    def __init__(self, table: pa.Table):
+        self._table = table
+        self._rows: "OrderedDict[int, _LazyRow]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return self._table.num_rows
+
+    def __getitem__(self, index: int) -> Mapping[str, Any]:
+        n = self._table.num_rows
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(f"row index out of range: {index}")
+
+        row = self._rows.get(index)
+        if row is None:
+            row = self._rows[index] = _LazyRow(self._table, index)
+            if len(self._rows) > _ROW_CACHE_SIZE:
+                self._rows.popitem(last=False)
+        else:
+            self._rows.move_to_end(index)
+        return row
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_oolong_answer(raw_ans: str) -> str:
+    """
+    Returns the normalized first answer from a stringified list like "['correct']",
+    exactly as ast.literal_eval would. The common single-element shape is
+    unquoted by hand; anything else falls back to literal_eval.
+    """
+    if "[" not in raw_ans:
+        # Without a list display literal_eval can't produce a list
+        return raw_ans.lower().strip()
+
+    quote = raw_ans[1:2]
+    if len(raw_ans) >= 4 and quote in ("'", '"') and raw_ans[0] == "[" and raw_ans[-2:] == quote + "]":
+        inner = raw_ans[2:-2]
+        # Escapes, control characters and line breaks need the real parser
+        if quote not in inner and "\\" not in inner and inner.isprintable():
+            return inner.lower().strip()
+
+    try:
+        answers = ast.literal_eval(raw_ans)
+    except (ValueError, SyntaxError):
+        return raw_ans.lower().strip()
+    if isinstance(answers, list) and answers:
+        return str(answers[0]).lower().strip()
+    return raw_ans.lower().strip()
 
 
 class OolongLogic(BenchmarkLogic):
-    def load_data(self, subset: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    __slots__ = ()
+
+    def load_data(self, subset: str, limit: Optional[int] = None) -> Sequence[Dict[str, Any]]:
         data_dir = BASE_DIR / "datasets" / "oolong" / "filtered_oolong_parquet"
         filename = f"{subset}_1024000_plus.parquet"
         file_path = data_dir / filename
@@ -16,11 +125,13 @@ class OolongLogic(BenchmarkLogic):
         if not file_path.exists():
             raise FileNotFoundError(f"Dataset not found: {file_path}")
 
-        ds = load_dataset("parquet", data_files=str(file_path), split="train")
+        table = _load_parquet(str(file_path))
         if limit:
-            ds = ds.select(range(min(limit, len(ds))))
+            table = table.slice(0, limit)
 
-        return list(ds)
+        # Rows are decoded on access, so only the item being worked on is
+        # ever held in Python objects
+        return _TableRows(table)
 
     def get_context(self, item: Dict[str, Any]) -> str:
         return item.get("context_window_text", "")
@@ -38,27 +149,23 @@ class OolongLogic(BenchmarkLogic):
         raw_ans = item.get("answer", "")
 
         # Oolong answers are often stringified lists like "['correct']"
-        try:
-            answers = ast.literal_eval(raw_ans)
-            if isinstance(answers, list) and answers:
-                target = str(answers[0]).lower().strip()
-            else:
-                target = str(raw_ans).lower().strip()
-        except (ValueError, SyntaxError):
+        if isinstance(raw_ans, str):
+            target = _parse_oolong_answer(raw_ans)
+        else:
             target = str(raw_ans).lower().strip()
 
         resp = agent_response.strip()
 
         # Look for "Label: answer" pattern
-        match = re.search(r"Label:\s*([a-zA-Z]+)", resp, re.IGNORECASE)
+        match = _LABEL_RE.search(resp)
         if match:
             prediction = match.group(1).lower()
         else:
-            # Fallback: extract last word and clean it
-            words = resp.split()
-            if words:
-                last_word = words[-1].lower()
-                prediction = re.sub(r"[^\w]", "", last_word)
+            # Fallback: extract last word and clean it (rsplit stops after one split)
+            tail = resp.rsplit(None, 1)
+            if tail:
+                last_word = tail[-1].lower()
+                prediction = _NONWORD_RE.sub("", last_word)
             else:
                 prediction = ""
 
@@ -1,16 +1,14 @@
 import argparse
+import importlib
 import logging
 import sys
-from pathlib import Path
 
-BASE_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(BASE_DIR))
-
-from base import BenchmarkEngine
+from benchmarks.base import BenchmarkEngine
 
+# Benchmark name -> (module, strategy class); modules are imported only when chosen
 AVAILABLE_BENCHMARKS = {
-    "longbench": "longbenchv2",
-    "oolong": "oolong",
+    "longbench": ("benchmarks.longbenchv2", "LongBenchLogic"),
+    "oolong": ("benchmarks.oolong", "OolongLogic"),
 }
 
 
@@ -59,6 +57,18 @@ def main() -> None:
         default=None,
         help="Optional directory to store DB files",
     )
+    parser.add_argument(
+        "--flush-every",
+        type=int,
+        default=32,
+        help="Flush the results file after every N records (default: 32)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes to run items in parallel (default: 1)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -72,19 +82,8 @@ def main() -> None:
     logger = logging.getLogger(__name__)
 
     # Import the appropriate strategy
-    strategy = None
-    if args.benchmark == "longbench":
-        from longbenchv2 import LongBenchLogic
-
-        strategy = LongBenchLogic()
-    elif args.benchmark == "oolong":
-        from oolong import OolongLogic
-
-        strategy = OolongLogic()
-
-    if not strategy:
-        logger.error("Unknown benchmark: %s", args.benchmark)
-        sys.exit(1)
+    module_name, class_name = AVAILABLE_BENCHMARKS[args.benchmark]
+    strategy = getattr(importlib.import_module(module_name), class_name)()
 
     runner = BenchmarkEngine(
         args.benchmark,
@@ -92,6 +91,8 @@ def main() -> None:
         strategy,
         max_chunk_tokens=args.chunk,
         db_output_dir=args.db_dir,
+        flush_every=args.flush_every,
+        workers=args.workers,
     )
 
     # Parse questions into list of 0-based indices
@@ -3,6 +3,16 @@ import json
 import os
 import argparse
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # =========================================================================
 # SPLIT CONFIGURATION
 # =========================================================================
@@ -34,49 +44,93 @@ SPLIT_DEFINITIONS = [
 
 # =========================================================================
 
+# Rules precompiled once: (filename, ((attribute, frozenset(allowed_values)), ...))
+COMPILED_DEFINITIONS = [
+    (
+        defn["filename"],
+        tuple((attribute, frozenset(values)) for attribute, values in defn["rules"].items()),
+    )
+    for defn in SPLIT_DEFINITIONS
+]
+
+# Single-attribute rules are inverted into {attribute: {value: [filenames]}} so
+# each object needs one hash lookup per attribute; other rules use matches_rules
+DISPATCH = {}
+GENERIC_DEFINITIONS = []
+for _filename, _rules in COMPILED_DEFINITIONS:
+    if len(_rules) == 1:
+        _attribute, _values = _rules[0]
+        _by_value = DISPATCH.setdefault(_attribute, {})
+        for _value in _values:
+            _by_value.setdefault(_value, []).append(_filename)
+    else:
+        GENERIC_DEFINITIONS.append((_filename, _rules))
+
 def matches_rules(obj, rules):
     """
-    Returns True if the object matches all key-value pairs in the rules dict.
+    Returns True if the object matches all (attribute, allowed_values) pairs in rules.
     """
-    for attribute, allowed_values in rules.items():
-        # Check if object has attribute and if its value is in our allowed list
-        if obj.get(attribute) not in allowed_values:
-            return False
-    return True
+    # Check if object has attribute and if its value is in our allowed set
+    try:
+        return all(obj.get(attribute) in allowed_values for attribute, allowed_values in rules)
+    except TypeError:
+        # Unhashable values (lists, dicts) can never equal an allowed value
+        return False
 
 def main():
     parser = argparse.ArgumentParser(description="Split a single JSON file into multiple files based on filters.")
     parser.add_argument("-i", "--input", default="longbenchv2should/data.json", help="Path to input JSON file.")
     args = parser.parse_args()
 
-    # 1. Load Data
+    # 1. Open Data
+    # With ijson the top-level list is streamed item by item; otherwise it is loaded whole
     print(f"Loading input: {args.input}")
     try:
-        with open(args.input, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        if not isinstance(data, list):
-            print("Error: Input JSON root must be a list.")
-            return
+        f = open(args.input, 'rb')
     except FileNotFoundError:
         print(f"Error: Could not find input file '{args.input}'")
         return
-    except json.JSONDecodeError:
-        print(f"Error: Invalid JSON in '{args.input}'")
-        return
 
-    # 2. Prepare Buckets
-    # We create a dictionary to hold the lists of objects for each file
-    output_buckets = {defn["filename"]: [] for defn in SPLIT_DEFINITIONS}
+    with f:
+        if ijson is not None:
+            if f.read(64).lstrip()[:1] != b"[":
+                print("Error: Input JSON root must be a list.")
+                return
+            f.seek(0)
+            data = ijson.items(f, 'item', use_float=True)
+            decode_errors = (ijson.JSONError,)
+        else:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError:
+                print(f"Error: Invalid JSON in '{args.input}'")
+                return
+            if not isinstance(data, list):
+                print("Error: Input JSON root must be a list.")
+                return
+            decode_errors = ()
 
-    # 3. Sort Objects into Buckets
-    for obj in data:
-        # Check this object against every definition in our list
-        for defn in SPLIT_DEFINITIONS:
-            filename = defn["filename"]
-            rules = defn["rules"]
-            
-            if matches_rules(obj, rules):
-                output_buckets[filename].append(obj)
+        # 2. Prepare Buckets
+        # We create a dictionary to hold the lists of objects for each file
+        output_buckets = {filename: [] for filename, _ in COMPILED_DEFINITIONS}
+
+        # 3. Sort Objects into Buckets
+        try:
+            for obj in data:
+                for attribute, by_value in DISPATCH.items():
+                    try:
+                        filenames = by_value.get(obj.get(attribute), ())
+                    except TypeError:
+                        continue
+                    for filename in filenames:
+                        output_buckets[filename].append(obj)
+                # Multi-attribute definitions still check every rule
+                for filename, rules in GENERIC_DEFINITIONS:
+                    if matches_rules(obj, rules):
+                        output_buckets[filename].append(obj)
+        except decode_errors:
+            print(f"Error: Invalid JSON in '{args.input}'")
+            return
 
     # 4. Write Files
     for filename, content in output_buckets.items():
@@ -86,8 +140,13 @@ def main():
             os.makedirs(directory)
             
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(content, f, indent=4, ensure_ascii=False)
+            if orjson is not None:
+                # orjson writes UTF-8 bytes directly (non-ASCII kept, like ensure_ascii=False)
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(content, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(content, f, indent=4, ensure_ascii=False)
             print(f"Saved {len(content)} objects to {filename}")
         except Exception as e:
             print(f"Error writing to {filename}: {e}")
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Generator, NamedTuple
+from bisect import bisect_right
+from typing import Generator, List, NamedTuple
 
 from src.utils.token_buffer import TokenBuffer
 
@@ -19,3 +20,36 @@ class BaseChunker(ABC):
     def chunk_text(self, text: str) -> Generator[ChunkResult, None, None]:
         """Yields text chunks based on the specific strategy."""
         pass
+
+    def _window_end(self, text: str, offsets: List[int], start: int) -> int:
+        """
+        Returns the end of the longest window starting at `start` that encodes to
+        at most max_tokens tokens, given the token start offsets from
+        TokenBuffer.token_offsets (with its len(text) sentinel). Always advances
+        past `start`, so only a single character that alone needs more than
+        max_tokens tokens can exceed the limit.
+        """
+        n_tokens = len(offsets) - 1
+        # `start` can land mid-token, so count from the token containing it
+        start_tok = bisect_right(offsets, start, 0, n_tokens) - 1
+        end_tok = start_tok + self.max_tokens
+        if end_tok >= n_tokens:
+            end = offsets[-1]
+        else:
+            end = offsets[end_tok]
+            if end <= start:
+                # Several tokens share one character; step to the next character
+                end = offsets[bisect_right(offsets, start)]
+
+        # The window re-encodes on its own: a token split by `start` (e.g. inside a
+        # multi-byte character) can become several, so clamp to the real count
+        encoding = self.token_buffer.encoding
+        tokens = encoding.encode(text[start:end], allowed_special='all')
+        while len(tokens) > self.max_tokens:
+            _, window_offsets = encoding.decode_with_offsets(tokens)
+            clamped = start + window_offsets[self.max_tokens]
+            if clamped <= start:
+                return start + 1
+            end = clamped
+            tokens = encoding.encode(text[start:end], allowed_special='all')
+        return end
@@ -3,10 +3,6 @@ from typing import Generator
 from src.chunking.base import BaseChunker, ChunkResult
 from src.utils.token_buffer import TokenBuffer
 
-# Average characters per token varies by language; 4 is typical for English
-# Using 6 as safety factor to ensure we capture enough text
-CHARS_PER_TOKEN_ESTIMATE = 6
-
 
 class FixedTokenChunker(BaseChunker):
     def __init__(
@@ -24,22 +20,17 @@ class FixedTokenChunker(BaseChunker):
         if not text:
             return
 
-        current_idx = 0
+        # Tokenize once up front; window ends are looked up in the offsets
+        offsets = self.token_buffer.token_offsets(text)
         text_len = len(text)
+        current_idx = 0
 
         while current_idx < text_len:
-            # Grab a window of characters large enough to cover max_tokens
-            char_window = self.max_tokens * CHARS_PER_TOKEN_ESTIMATE
-            raw_end = min(current_idx + char_window, text_len)
-            window_text = text[current_idx:raw_end]
-
-            # Use TokenBuffer to find the precise character cut for max_tokens
-            chunk_text = self.token_buffer.get_chunk_at(self.max_tokens, text=window_text)
-            chunk_len = len(chunk_text)
-            abs_end = current_idx + chunk_len
+            abs_end = self._window_end(text, offsets, current_idx)
+            chunk_len = abs_end - current_idx
 
             yield ChunkResult(
-                text=chunk_text,
+                text=text[current_idx:abs_end],
                 start_index=current_idx,
                 end_index=abs_end,
             )
@@ -1,41 +1,52 @@
+import hashlib
 import json
 import logging
 import re
+from collections import OrderedDict
 from typing import Any, Dict, Generator
 
 from src.chunking.base import BaseChunker, ChunkResult
+from src.config.config import ModelConfig
 from src.core.factory import AgentFactory, ModelRotator
 from src.utils.token_buffer import TokenBuffer
 
 logger = logging.getLogger(__name__)
 
-# Characters per token estimate for window sizing
-CHARS_PER_TOKEN_ESTIMATE = 6
 # Default overlap when LLM doesn't provide valid next_start
 DEFAULT_OVERLAP_CHARS = 50
 # Maximum characters to show in prompt for cut-point detection
 MAX_PROMPT_CHARS = 2000
+# Number of cut-point answers remembered across windows (LRU)
+CUT_CACHE_SIZE = 1024
+
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL | re.IGNORECASE)
+_JSON_OBJ_RE = re.compile(r"\{[^{}]*\}")
 
 
 class SemanticBoundaryChunker(BaseChunker):
+    # Cut points keyed by prompt hash; shared across instances so repeated windows skip the LLM
+    _cut_cache: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+
     def __init__(self, max_tokens: int, token_buffer: TokenBuffer):
         super().__init__(max_tokens, token_buffer)
         self.agent, self.rotator = AgentFactory.create_rotating_agent("smart-ingest-agent")
+        # One model per pool entry; rotation swaps references instead of rebuilding clients.
+        # This is the only model cache: keycycle models rotate credentials and reset their
+        # client per request, so they are only safe to reuse within one single-threaded
+        # chunker, never across the indexer's or validator's worker threads.
+        self._models: Dict[ModelConfig, Any] = {}
 
     def chunk_text(self, text: str) -> Generator[ChunkResult, None, None]:
         if not text:
             return
 
+        # Tokenize once up front instead of re-encoding every window
+        offsets = self.token_buffer.token_offsets(text)
         current_idx = 0
 
         while current_idx < len(text):
-            # Get a window slightly larger than max_tokens to give the LLM choices
-            char_window = self.max_tokens * CHARS_PER_TOKEN_ESTIMATE
-            raw_end = min(current_idx + char_window, len(text))
-            window_text = text[current_idx:raw_end]
-
-            # Trim to max tokens strict limit to ensure we don't overflow context
-            valid_window = self.token_buffer.get_chunk_at(self.max_tokens, text=window_text)
+            # Window of max_tokens tokens, the strict limit for the LLM's context
+            valid_window = text[current_idx:self._window_end(text, offsets, current_idx)]
 
             # Ask LLM to find the break point
             cut_data = self._find_cut_point(valid_window)
@@ -74,12 +85,22 @@ class SemanticBoundaryChunker(BaseChunker):
             f'Return JSON: {{ "cut_index": <int>, "next_chunk_start_index": <int> }}'
         )
 
+        cache_key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        cached = self._cut_cache.get(cache_key)
+        if cached is not None:
+            self._cut_cache.move_to_end(cache_key)
+            logger.debug("Cut point cache hit for %d-char window", len(text))
+            return dict(cached)
+
         last_error = None
         for attempt in range(max_retries):
             try:
                 # Rotate model before each call
                 model_config = self.rotator.get_next_config()
-                self.agent.model = AgentFactory.create_model(model_config)
+                model = self._models.get(model_config)
+                if model is None:
+                    model = self._models[model_config] = AgentFactory.create_model(model_config)
+                self.agent.model = model
                 logger.debug("Using model: %s/%s", model_config.provider, model_config.model_id)
 
                 response = self.agent.run(prompt)
@@ -101,10 +122,14 @@ class SemanticBoundaryChunker(BaseChunker):
                 if next_start >= cut:
                     next_start = max(0, cut - DEFAULT_OVERLAP_CHARS)
 
-                return {
+                result = {
                     "cut_index": cut,
                     "next_chunk_start_index": next_start,
                 }
+                self._cut_cache[cache_key] = result
+                if len(self._cut_cache) > CUT_CACHE_SIZE:
+                    self._cut_cache.popitem(last=False)
+                return dict(result)
 
             except Exception as e:
                 logger.warning(
@@ -119,7 +144,7 @@ class SemanticBoundaryChunker(BaseChunker):
     def _extract_json(self, content: str) -> Dict[str, Any]:
         """Extract JSON from LLM response, handling code blocks and think tags."""
         # Remove think tags if present
-        content = re.sub(r"<think>.*?</think>", "", content, flags=re.DOTALL | re.IGNORECASE)
+        content = _THINK_RE.sub("", content)
 
         # Try to extract from code blocks
         if "```json" in content:
@@ -136,7 +161,7 @@ class SemanticBoundaryChunker(BaseChunker):
             pass
 
         # Try to find JSON object pattern
-        match = re.search(r"\{[^{}]*\}", content)
+        match = _JSON_OBJ_RE.search(content)
         if match:
             try:
                 return json.loads(match.group())
@@ -1,11 +1,34 @@
+import functools
+import marshal
+import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-import yaml
+# How long a successful config check is trusted before the file is stat()ed again
+STAT_TTL_SECONDS = 1.0
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _yaml_codec() -> Tuple[Any, Any, Any]:
+    """
+    Imports PyYAML on first use, since warm starts are served from the marshal
+    side file. Returns (yaml, Loader, Dumper), preferring the libyaml C classes.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as Dumper
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+        from yaml import SafeLoader as Loader
+    return yaml, Loader, Dumper
+
+
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     provider: str
     model_id: str
@@ -19,7 +42,7 @@ class ModelConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelPoolConfig:
     """Configuration for model rotation (multiple models)."""
 
@@ -33,7 +56,7 @@ class ModelPoolConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StorageConfig:
     db_path: str
     session_table: str
@@ -51,7 +74,7 @@ class StorageConfig:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
     agent_id: str
     instructions: List[str]
@@ -68,7 +91,14 @@ class AgentConfig:
 class AgentConfigLoader:
     def __init__(self, config_path: Optional[str] = None):
         self._config_cache: Dict[str, AgentConfig] = {}
-        self._last_mtime: float = 0.0
+        # Read-only view handed to callers, rebuilt on reload
+        self._config_view: Mapping[str, AgentConfig] = MappingProxyType(self._config_cache)
+        # agent_id -> (raw YAML entry, built config or None until first requested)
+        self._entries: Dict[str, Tuple[Dict[str, Any], Optional[AgentConfig]]] = {}
+        # (st_mtime_ns, st_size) of the YAML the cache was built from
+        self._last_key: Optional[Tuple[int, int]] = None
+        # time.monotonic() before which the file is not re-checked
+        self._next_check: float = 0.0
 
         if config_path:
             self.file_path = Path(config_path)
@@ -76,99 +106,199 @@ class AgentConfigLoader:
             self.file_path = Path(__file__).resolve().parent / "agents.yaml"
 
     def _load_if_needed(self) -> None:
-        if not self.file_path.exists():
+        # Bursts of get_agent() calls (e.g. one per created agent) skip the syscall
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
             self._config_cache = {}
-            self._last_mtime = 0
-            raise FileNotFoundError(f"Configuration file {self.file_path} not found.")
+            self._config_view = MappingProxyType(self._config_cache)
+            self._entries = {}
+            self._last_key = None
+            raise FileNotFoundError(f"Configuration file {self.file_path} not found.") from None
 
-        current_mtime = self.file_path.stat().st_mtime
+        current_key = (stat.st_mtime_ns, stat.st_size)
+        self._next_check = now + STAT_TTL_SECONDS
 
-        if self._config_cache and current_mtime == self._last_mtime:
+        if current_key == self._last_key:
             return
 
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            data: Dict[str, Dict[str, Any]] = yaml.safe_load(f) or {}
+        data = self._read_raw(current_key)
 
-        configs: Dict[str, AgentConfig] = {}
+        # Unchanged agents keep their instances; changed or new ones are built on
+        # first request, since a caller typically needs only one agent
+        entries: Dict[str, Tuple[Dict[str, Any], Optional[AgentConfig]]] = {}
         for agent_id, agent_data in data.items():
-            # Parse single model OR model pool (rotation)
-            model_data: Optional[ModelConfig] = None
-            model_pool: Optional[ModelPoolConfig] = None
-
-            if "models" in agent_data:
-                # Model rotation config
-                temperature = agent_data.get("temperature", 0.0)
-                models_list = [
-                    ModelConfig(
-                        provider=m["provider"],
-                        model_id=m["model_id"],
-                        temperature=temperature,
-                    )
-                    for m in agent_data["models"]
-                ]
-                model_pool = ModelPoolConfig(
-                    models=models_list,
-                    calls_per_model=agent_data.get("calls_per_model", 3),
+            previous = self._entries.get(agent_id)
+            if previous is not None and previous[0] == agent_data:
+                entries[agent_id] = previous
+            else:
+                entries[agent_id] = (agent_data, None)
+
+        self._entries = entries
+        self._config_cache = {
+            agent_id: entry[1] for agent_id, entry in entries.items() if entry[1] is not None
+        }
+        self._config_view = MappingProxyType(self._config_cache)
+        self._last_key = current_key
+
+    @staticmethod
+    def _build_agent(agent_id: str, agent_data: Dict[str, Any]) -> AgentConfig:
+        # Parse single model OR model pool (rotation)
+        model_data: Optional[ModelConfig] = None
+        model_pool: Optional[ModelPoolConfig] = None
+
+        if "models" in agent_data:
+            # Model rotation config
+            temperature = agent_data.get("temperature", 0.0)
+            models_list = [
+                ModelConfig(
+                    provider=m["provider"],
+                    model_id=m["model_id"],
+                    temperature=temperature,
                 )
-            elif "model" in agent_data:
-                # Single model config
-                model_data = ModelConfig(**agent_data["model"])
-
-            storage_data = None
-            storage_dict = agent_data.get("storage")
-            if storage_dict:
-                storage_data = StorageConfig(**storage_dict)
-
-            configs[agent_id] = AgentConfig(
-                agent_id=agent_id,
-                instructions=agent_data.get("instructions", []),
-                tools=agent_data.get("tools", []),
-                model_settings=model_data,
-                storage_settings=storage_data,
-                model_pool=model_pool,
+                for m in agent_data["models"]
+            ]
+            model_pool = ModelPoolConfig(
+                models=models_list,
+                calls_per_model=agent_data.get("calls_per_model", 3),
             )
-
-        self._config_cache = configs
-        self._last_mtime = current_mtime
+        elif "model" in agent_data:
+            # Single model config
+            model_data = ModelConfig(**agent_data["model"])
+
+        storage_data = None
+        storage_dict = agent_data.get("storage")
+        if storage_dict:
+            storage_data = StorageConfig(**storage_dict)
+
+        return AgentConfig(
+            agent_id=agent_id,
+            instructions=agent_data.get("instructions", []),
+            tools=agent_data.get("tools", []),
+            model_settings=model_data,
+            storage_settings=storage_data,
+            model_pool=model_pool,
+        )
+
+    def _read_raw(self, key: Tuple[int, int]) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the parsed YAML as plain dicts. A marshal side file keyed by the
+        YAML's (mtime_ns, size) is used when fresh, since YAML parsing is slow.
+        """
+        cache_path = self.file_path.with_name(self.file_path.name + ".mcache")
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, data = marshal.load(f)
+            if tuple(cached_key) == key:
+                return data
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+        yaml, loader, _ = _yaml_codec()
+        data = yaml.load(self.file_path.read_bytes(), Loader=loader) or {}
+
+        # Best effort: skip the cache if it can't be written or the YAML holds
+        # values marshal doesn't support (e.g. dates)
+        try:
+            payload = marshal.dumps((key, data))
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError):
+            pass
+
+        return data
+
+    def _materialize(self, agent_id: str, agent_data: Dict[str, Any]) -> AgentConfig:
+        config = self._build_agent(agent_id, agent_data)
+        self._entries[agent_id] = (agent_data, config)
+        self._config_cache[agent_id] = config
+        return config
 
     def get_agent(self, agent_id: str) -> Optional[AgentConfig]:
         """Get a specific agent config (auto-reloads if needed)."""
         self._load_if_needed()
-        return self._config_cache.get(agent_id)
+        config = self._config_cache.get(agent_id)
+        if config is None:
+            entry = self._entries.get(agent_id)
+            if entry is None:
+                return None
+            config = self._materialize(agent_id, entry[0])
+        return config
+
+    def get_all_agents(self) -> Mapping[str, AgentConfig]:
+        """Get all configs as a read-only mapping, in file order."""
+        self._load_if_needed()
+        if len(self._config_cache) != len(self._entries):
+            for agent_id, (agent_data, config) in list(self._entries.items()):
+                if config is None:
+                    self._materialize(agent_id, agent_data)
+            # Lazily built agents were cached in request order; restore file order
+            self._config_cache = {agent_id: entry[1] for agent_id, entry in self._entries.items()}
+            self._config_view = MappingProxyType(self._config_cache)
+        return self._config_view
+
+    def set_agent(self, config: AgentConfig) -> None:
+        """Adds or replaces an agent in memory; call save() to persist it."""
+        self._load_if_needed()
+        self._entries[config.agent_id] = (self._agent_to_dict(config), config)
+        self._config_cache[config.agent_id] = config
 
-    def get_all_agents(self) -> Dict[str, AgentConfig]:
-        """Get all configs."""
+    def remove_agent(self, agent_id: str) -> None:
+        """Removes an agent in memory; call save() to persist the removal."""
         self._load_if_needed()
-        return self._config_cache
+        if agent_id not in self._entries:
+            raise KeyError(agent_id)
+        del self._entries[agent_id]
+        self._config_cache.pop(agent_id, None)
+
+    @staticmethod
+    def _agent_to_dict(config: AgentConfig) -> Dict[str, Any]:
+        """Inverse of _build_agent: the YAML entry for one agent."""
+        agent_dict: Dict[str, Any] = {
+            "instructions": config.instructions,
+            "tools": config.tools,
+        }
+        if config.model_pool:
+            # Save model rotation config
+            agent_dict["models"] = [
+                {"provider": m.provider, "model_id": m.model_id}
+                for m in config.model_pool.models
+            ]
+            agent_dict["temperature"] = config.model_pool.models[0].temperature
+            agent_dict["calls_per_model"] = config.model_pool.calls_per_model
+        elif config.model_settings:
+            agent_dict["model"] = config.model_settings.to_dict()
+        if config.storage_settings:
+            agent_dict["storage"] = config.storage_settings.to_dict()
+        return agent_dict
 
     def save(self) -> None:
         """Save current config cache to file."""
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        data: Dict[str, Dict[str, Any]] = {}
-        for agent_id, config in self._config_cache.items():
-            agent_dict: Dict[str, Any] = {
-                "instructions": config.instructions,
-                "tools": config.tools,
-            }
-            if config.model_pool:
-                # Save model rotation config
-                agent_dict["models"] = [
-                    {"provider": m.provider, "model_id": m.model_id}
-                    for m in config.model_pool.models
-                ]
-                agent_dict["temperature"] = config.model_pool.models[0].temperature
-                agent_dict["calls_per_model"] = config.model_pool.calls_per_model
-            elif config.model_settings:
-                agent_dict["model"] = config.model_settings.to_dict()
-            if config.storage_settings:
-                agent_dict["storage"] = config.storage_settings.to_dict()
-            data[agent_id] = agent_dict
+        data: Dict[str, Dict[str, Any]] = {
+            agent_id: self._agent_to_dict(config)
+            for agent_id, config in self.get_all_agents().items()
+        }
+        # What is on disk now; a later reload compares against these entries
+        self._entries = {
+            agent_id: (data[agent_id], config) for agent_id, config in self._config_cache.items()
+        }
 
+        yaml, _, dumper = _yaml_codec()
         with open(self.file_path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, sort_keys=False)
+            yaml.dump(data, f, Dumper=dumper, sort_keys=False)
+            # fstat the open handle rather than resolving the path again
+            f.flush()
+            stat = os.fstat(f.fileno())
 
-        self._last_mtime = self.file_path.stat().st_mtime
+        self._last_key = (stat.st_mtime_ns, stat.st_size)
 
 
 CONFIG = AgentConfigLoader()
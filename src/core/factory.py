@@ -1,18 +1,26 @@
+import itertools
 import logging
 import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from agno.agent import Agent
-from agno.db.sqlite import SqliteDb
-from agno.tracing import setup_tracing
-from keycycle import MultiProviderWrapper
-
-from src.config.config import ModelConfig, ModelPoolConfig, CONFIG
+from src.config.config import AgentConfig, ModelConfig, ModelPoolConfig, CONFIG
 from src.tools.rlm_tools import TOOL_REGISTRY
 
+# agno's Agent/SqliteDb/tracing and keycycle are imported on first agent or
+# wrapper creation; they dominate import time for modules that only need
+# ModelRotator or the factory's types
+if TYPE_CHECKING:
+    from agno.agent import Agent
+    from agno.db.sqlite import SqliteDb
+    from keycycle import MultiProviderWrapper
+
 logger = logging.getLogger(__name__)
 
+# Resolved once at import instead of per agent/wrapper creation
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_ENV_FILE = _PROJECT_ROOT / ".env"
+
 
 class ModelRotator:
     """Thread-safe round-robin model rotator with configurable calls per model."""
@@ -20,34 +28,33 @@ class ModelRotator:
     def __init__(self, configs: List[ModelConfig], calls_per_model: int = 3):
         self._configs = configs
         self._calls_per_model = calls_per_model
-        self._index = 0
-        self._call_count = 0
+        # Each config repeated calls_per_model times; the shared counter walks it, so
+        # get_next_config needs no lock (itertools.count's __next__ is atomic under the GIL)
+        self._schedule = tuple(c for c in configs for _ in range(calls_per_model))
+        self._counter = itertools.count()
         self._lock = threading.Lock()
 
     def get_next_config(self) -> ModelConfig:
         """Get the next model config, rotating after calls_per_model calls."""
-        with self._lock:
-            config = self._configs[self._index]
-            self._call_count += 1
-            if self._call_count >= self._calls_per_model:
-                self._call_count = 0
-                self._index = (self._index + 1) % len(self._configs)
-                logger.debug(
-                    "Rotating to model %s/%s",
-                    self._index + 1,
-                    len(self._configs),
-                )
-            return config
+        slot = next(self._counter) % len(self._schedule)
+        if slot % self._calls_per_model == self._calls_per_model - 1:
+            logger.debug(
+                "Rotating to model %s/%s",
+                (slot // self._calls_per_model + 1) % len(self._configs) + 1,
+                len(self._configs),
+            )
+        return self._schedule[slot]
 
     def force_rotate(self) -> None:
         """Force immediate rotation to next model (used on failure)."""
         with self._lock:
-            self._call_count = 0
-            self._index = (self._index + 1) % len(self._configs)
-            next_config = self._configs[self._index]
+            slot = next(self._counter) % len(self._schedule)
+            index = (slot // self._calls_per_model + 1) % len(self._configs)
+            self._counter = itertools.count(index * self._calls_per_model)
+            next_config = self._configs[index]
             logger.warning(
                 "Forced rotation due to failure. Now on model %d/%d: %s/%s",
-                self._index + 1,
+                index + 1,
                 len(self._configs),
                 next_config.provider,
                 next_config.model_id,
@@ -58,22 +65,54 @@ class ModelRotator:
 
 
 class AgentFactory:
-    _wrapper_cache: Dict[str, MultiProviderWrapper] = {}
+    _wrapper_cache: Dict[str, "MultiProviderWrapper"] = {}
+    # Stateless toolkits shared across agents; RLMTools is per-agent since rebind() mutates it
+    _tool_cache: Dict[str, Any] = {}
+    # Session DBs keyed by (db_file, session_table); tracing is set up once per DB on creation
+    _db_cache: Dict[Tuple[str, str], "SqliteDb"] = {}
+    # agent_id -> (AgentConfig it was resolved from, config-only Agent kwargs, session DB file)
+    _static_kwargs_cache: Dict[str, Tuple[AgentConfig, Dict[str, Any], Optional[str]]] = {}
+    # tool name list -> registered (name, toolkit class) pairs, unknown names dropped
+    _tool_resolution_cache: Dict[Tuple[str, ...], Tuple[Tuple[str, type], ...]] = {}
     _cache_lock = threading.Lock()
 
     @classmethod
-    def _get_cached_wrapper(cls, provider: str) -> MultiProviderWrapper:
+    def _get_cached_wrapper(cls, provider: str) -> "MultiProviderWrapper":
         """Retrieves a wrapper from cache or creates a new one if it doesn't exist."""
         with cls._cache_lock:
             if provider not in cls._wrapper_cache:
+                from keycycle import MultiProviderWrapper
+
                 logger.info("Initializing new MultiProviderWrapper for %s", provider)
                 cls._wrapper_cache[provider] = MultiProviderWrapper.from_env(
                     provider=provider,
                     default_model_id=None,
-                    env_file=Path(__file__).resolve().parents[2] / ".env",
+                    env_file=_ENV_FILE,
                 )
         return cls._wrapper_cache[provider]
 
+    @classmethod
+    def _get_cached_db(cls, db_file: str, session_table: str) -> "SqliteDb":
+        """Retrieves the shared session DB for (db_file, session_table), creating and tracing it once."""
+        key = (db_file, session_table)
+        with cls._cache_lock:
+            if key not in cls._db_cache:
+                from agno.db.sqlite import SqliteDb
+                from agno.tracing import setup_tracing
+
+                agent_db = SqliteDb(db_file=db_file, session_table=session_table)
+                setup_tracing(db=agent_db, batch_processing=True)
+                cls._db_cache[key] = agent_db
+        return cls._db_cache[key]
+
+    @classmethod
+    def _get_cached_tool(cls, name: str, tool_cls: type) -> Any:
+        """Returns the shared instance of a stateless toolkit, creating it on first use."""
+        with cls._cache_lock:
+            if name not in cls._tool_cache:
+                cls._tool_cache[name] = tool_cls()
+        return cls._tool_cache[name]
+
     @staticmethod
     def create_model(
         model_settings: ModelConfig,
@@ -93,6 +132,21 @@ class AgentFactory:
 
         return wrapper.get_model(**kwargs)
 
+    @classmethod
+    def _resolve_tools(cls, tool_names: Tuple[str, ...]) -> Tuple[Tuple[str, type], ...]:
+        """Looks tool names up in the registry once per distinct name list."""
+        resolved = cls._tool_resolution_cache.get(tool_names)
+        if resolved is None:
+            pairs = []
+            for name in tool_names:
+                tool_cls = TOOL_REGISTRY.get(name)
+                if not tool_cls:
+                    logger.warning("Tool '%s' not found in registry. Skipping.", name)
+                    continue
+                pairs.append((name, tool_cls))
+            resolved = cls._tool_resolution_cache[tool_names] = tuple(pairs)
+        return resolved
+
     @staticmethod
     def _hydrate_tools(tool_names: List[str], content_db_path: Optional[str] = None) -> list:
         """Converts a list of string tool names into initialized Toolkit objects."""
@@ -100,22 +154,51 @@ class AgentFactory:
             return []
 
         hydrated_tools = []
-        for name in tool_names:
-            tool_cls = TOOL_REGISTRY.get(name)
-            if not tool_cls:
-                logger.warning("Tool '%s' not found in registry. Skipping.", name)
-                continue
-
+        for name, tool_cls in AgentFactory._resolve_tools(tuple(tool_names)):
             if name == "RLMTools":
                 if content_db_path:
                     hydrated_tools.append(tool_cls(db_path=content_db_path))
                 else:
                     logger.warning("RLMTools requires content_db_path. Skipping.")
             else:
-                hydrated_tools.append(tool_cls())
+                hydrated_tools.append(AgentFactory._get_cached_tool(name, tool_cls))
 
         return hydrated_tools
 
+    @classmethod
+    def _get_static_kwargs(
+        cls, agent_id: str, config_record: AgentConfig
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Resolves the Agent kwargs that depend only on the agent's config, plus the
+        absolute session DB file. Cached per agent_id and rebuilt whenever CONFIG
+        hands back a different AgentConfig instance (i.e. its YAML entry changed).
+        """
+        cached = cls._static_kwargs_cache.get(agent_id)
+        if cached is not None and cached[0] is config_record:
+            return cached[1], cached[2]
+
+        static_kwargs: Dict[str, Any] = {
+            "id": agent_id,
+            "name": agent_id.replace("-", " ").title(),
+            "instructions": config_record.instructions,
+            "add_history_to_context": False,
+            "read_chat_history": False,
+            "markdown": True,
+        }
+        db_file = None
+
+        storage_settings = config_record.storage_settings
+        if storage_settings and storage_settings.db_path:
+            db_file = str(_PROJECT_ROOT / storage_settings.db_path)
+            static_kwargs["add_history_to_context"] = storage_settings.add_history_to_context
+            static_kwargs["read_chat_history"] = storage_settings.read_chat_history
+            if storage_settings.num_history_runs:
+                static_kwargs["num_history_runs"] = storage_settings.num_history_runs
+
+        cls._static_kwargs_cache[agent_id] = (config_record, static_kwargs, db_file)
+        return static_kwargs, db_file
+
     @staticmethod
     def create_agent(
         agent_id: str,
@@ -123,7 +206,9 @@ class AgentFactory:
         content_db_path: Optional[str] = None,
         estimated_tokens: int = 1000,
         key_index: Optional[int] = None,
-    ) -> Agent:
+    ) -> "Agent":
+        from agno.agent import Agent
+
         config_record = CONFIG.get_agent(agent_id)
         if not config_record:
             raise ValueError(f"No configuration found for agent_id: {agent_id}")
@@ -145,53 +230,47 @@ class AgentFactory:
         else:
             raise ValueError(f"No model configuration found for agent_id: {agent_id}")
 
-        project_root = Path(__file__).resolve().parent.parent.parent
-        storage_settings = config_record.storage_settings
-
-        agent_db = None
-        add_history_to_context = False
-        num_history_runs = None
-        read_chat_history = False
+        static_kwargs, db_file = AgentFactory._get_static_kwargs(agent_id, config_record)
+        agent_kwargs = dict(static_kwargs)
 
-        if storage_settings and storage_settings.db_path:
-            agent_db = SqliteDb(
-                db_file=str(project_root / storage_settings.db_path),
-                session_table=storage_settings.session_table,
+        if db_file:
+            agent_kwargs["db"] = AgentFactory._get_cached_db(
+                db_file, config_record.storage_settings.session_table
             )
-            setup_tracing(db=agent_db, batch_processing=True)
-            add_history_to_context = storage_settings.add_history_to_context
-            num_history_runs = storage_settings.num_history_runs
-            read_chat_history = storage_settings.read_chat_history
-
-        tools = AgentFactory._hydrate_tools(config_record.tools, content_db_path)
 
-        agent_kwargs = {
-            "id": agent_id,
-            "name": agent_id.replace("-", " ").title(),
-            "model": model,
-            "tools": tools,
-            "instructions": config_record.instructions,
-            "add_history_to_context": add_history_to_context,
-            "read_chat_history": read_chat_history,
-            "markdown": True,
-        }
-
-        if agent_db:
-            agent_kwargs["db"] = agent_db
+        agent_kwargs["model"] = model
+        agent_kwargs["tools"] = AgentFactory._hydrate_tools(config_record.tools, content_db_path)
         if session_id:
             agent_kwargs["session_id"] = session_id
-        if num_history_runs:
-            agent_kwargs["num_history_runs"] = num_history_runs
 
         return Agent(**agent_kwargs)
 
+    @staticmethod
+    def rebind(
+        agent: "Agent",
+        content_db_path: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> "Agent":
+        """
+        Points an existing agent at a new content DB and/or session in place,
+        avoiding a full create_agent() per benchmark item.
+        """
+        if content_db_path:
+            rlm_tools_cls = TOOL_REGISTRY["RLMTools"]
+            for tool in agent.tools or []:
+                if isinstance(tool, rlm_tools_cls):
+                    tool.db_path = content_db_path
+        if session_id:
+            agent.session_id = session_id
+        return agent
+
     @staticmethod
     def create_rotating_agent(
         agent_id: str,
         session_id: Optional[str] = None,
         content_db_path: Optional[str] = None,
         estimated_tokens: int = 1000,
-    ) -> Tuple[Agent, ModelRotator]:
+    ) -> Tuple["Agent", ModelRotator]:
         """
         Create an agent with a ModelRotator for model rotation.
 
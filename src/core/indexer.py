@@ -3,7 +3,7 @@ import queue
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from src.chunking.base import BaseChunker
 from src.chunking.fixed import FixedTokenChunker
@@ -41,6 +41,9 @@ class Indexer:
         self.db_lock = threading.Lock()
         self.max_workers = num_keys
 
+        # Set by the caller of ingest_text to abandon the ingestion in progress
+        self._stop: Optional[threading.Event] = None
+
         self.chunker: BaseChunker
         if strategy == "llm":
             self.chunker = SemanticBoundaryChunker(max_chunk_tokens, self.token_buffer)
@@ -61,6 +64,12 @@ class Indexer:
         else:
             self.summary_rotator = None
 
+    def retarget(self, db_path: str) -> None:
+        """Switches the output DB while keeping the tokenizer, chunker and rotator."""
+        if db_path != self.db_path:
+            self.db_path = db_path
+            self.storage = StorageEngine(self.db_path)
+
     def _get_summary_from_llm(self, prompt: str, max_retries: int = 3) -> str:
         """Thread-safe wrapper with retry and force rotation on failure."""
         key_index = self.key_queue.get()
@@ -112,21 +121,61 @@ class Indexer:
         if not path.is_file():
             raise ValueError(f"Path is not a file: {file_path}")
 
-        logger.info("Indexing %s using %d threads", file_path, self.max_workers)
-
         with path.open("r", encoding="utf-8") as f:
             full_text = f.read()
 
-        if not full_text.strip():
-            logger.warning("File is empty: %s", file_path)
+        self.ingest_text(full_text, source_name=path.name, group_size=group_size, max_depth=max_depth)
+
+    def ingest_text(
+        self,
+        text: str,
+        source_name: str = "benchmark",
+        group_size: int = 5,
+        max_depth: int = 1,
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Indexes an in-memory string; same chunking/summarization path as ingest_file.
+        If `stop` gets set, returns early between stages and skips LLM calls not yet
+        started, leaving a partial index behind.
+        """
+        logger.info("Indexing %s using %d threads", source_name, self.max_workers)
+
+        if not text.strip():
+            logger.warning("Text is empty: %s", source_name)
             return
 
-        level_0_ids = self._process_chunks_parallel(full_text, path.name)
+        self._stop = stop
+        try:
+            level_0_ids = self._process_chunks_parallel(text, source_name)
+            if self._stopped():
+                logger.info("Indexing stopped for %s", source_name)
+                return
+
+            if max_depth > 0 and len(level_0_ids) > 1:
+                self._build_hierarchy_parallel(level_0_ids, group_size=group_size, max_depth=max_depth)
+        finally:
+            self._stop = None
+
+        logger.info("Indexing complete for %s", source_name)
+
+    def _stopped(self) -> bool:
+        return self._stop is not None and self._stop.is_set()
+
+    def _summarize_all(self, prompts: List[str]) -> Iterator[str]:
+        """Yields summaries in prompt order; ends early once the ingestion is stopped."""
 
-        if max_depth > 0 and len(level_0_ids) > 1:
-            self._build_hierarchy_parallel(level_0_ids, group_size=group_size, max_depth=max_depth)
+        def summarize(prompt: str) -> Optional[str]:
+            # Queued calls are skipped; calls already in flight still finish
+            if self._stopped():
+                return None
+            return self._get_summary_from_llm(prompt)
 
-        logger.info("Indexing complete for %s", file_path)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for summary_text in executor.map(summarize, prompts):
+                if summary_text is None:
+                    return
+                yield summary_text
 
     def _process_chunks_parallel(self, full_text: str, filename: str) -> List[int]:
         """
@@ -138,16 +187,11 @@ class Indexer:
         logger.info("Chunking text...")
         chunks = list(self.chunker.chunk_text(full_text))
 
-        chunk_ids = []
         with self.db_lock:
-            for chunk_res in chunks:
-                chunk_id = self.storage.add_chunk(
-                    text=chunk_res.text,
-                    start=chunk_res.start_index,
-                    end=chunk_res.end_index,
-                    source=filename,
-                )
-                chunk_ids.append(chunk_id)
+            chunk_ids = self.storage.add_chunks(
+                ((c.text, c.start_index, c.end_index) for c in chunks),
+                source=filename,
+            )
 
         logger.info("Generated %d chunks. Starting parallel summarization...", len(chunk_ids))
 
@@ -158,18 +202,16 @@ class Indexer:
         ]
 
         summary_ids = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            summary_iterator = executor.map(self._get_summary_from_llm, prompts)
-            for sequence_index, summary_text in enumerate(summary_iterator):
-                with self.db_lock:
-                    sum_id = self.storage.add_summary(
-                        text=summary_text,
-                        level=0,
-                        parent_id=None,
-                        sequence_index=sequence_index,
-                    )
-                    self.storage.link_summary_to_chunk(sum_id, chunk_ids[sequence_index])
-                    summary_ids.append(sum_id)
+        for sequence_index, summary_text in enumerate(self._summarize_all(prompts)):
+            with self.db_lock:
+                sum_id = self.storage.add_summary(
+                    text=summary_text,
+                    level=0,
+                    parent_id=None,
+                    sequence_index=sequence_index,
+                    chunk_id=chunk_ids[sequence_index],
+                )
+                summary_ids.append(sum_id)
 
         return summary_ids
 
@@ -186,7 +228,7 @@ class Indexer:
         current_ids = child_ids
         current_level = 0
 
-        while current_level < max_depth and len(current_ids) > 1:
+        while current_level < max_depth and len(current_ids) > 1 and not self._stopped():
             logger.info("Building Level %d from %d nodes...", current_level + 1, len(current_ids))
 
             batches_ids = []
@@ -207,22 +249,18 @@ class Indexer:
 
             next_level_ids = []
 
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                summary_iterator = executor.map(self._get_summary_from_llm, prompts)
-
-                for sequence_index, summary_text in enumerate(summary_iterator):
-                    batch_ids = batches_ids[sequence_index]
+            for sequence_index, summary_text in enumerate(self._summarize_all(prompts)):
+                batch_ids = batches_ids[sequence_index]
 
-                    with self.db_lock:
-                        parent_id = self.storage.add_summary(
-                            text=summary_text,
-                            level=current_level + 1,
-                            sequence_index=sequence_index,
-                        )
-                        for child_id in batch_ids:
-                            self.storage.update_summary_parent(child_id, parent_id)
+                with self.db_lock:
+                    parent_id = self.storage.add_summary(
+                        text=summary_text,
+                        level=current_level + 1,
+                        sequence_index=sequence_index,
+                    )
+                    self.storage.update_summary_parents(batch_ids, parent_id)
 
-                        next_level_ids.append(parent_id)
+                    next_level_ids.append(parent_id)
 
             current_ids = next_level_ids
             current_level += 1
@@ -352,13 +352,13 @@ class DatabaseValidator:
                         with self.db_lock:
                             # Get the next sequence index for level 0
                             seq_idx = self.storage.get_next_sequence_index(level=0)
-                            sum_id = self.storage.add_summary(
+                            self.storage.add_summary(
                                 text=summary_text,
                                 level=0,
                                 parent_id=None,
                                 sequence_index=seq_idx,
+                                chunk_id=chunk_id,
                             )
-                            self.storage.link_summary_to_chunk(sum_id, chunk_id)
                         results["success"] += 1
                         logger.debug("Generated level-0 summary for chunk %d", chunk_id)
                     else:
@@ -456,8 +456,7 @@ class DatabaseValidator:
                             level=current_level + 1,
                             sequence_index=seq_idx,
                         )
-                        for child_id in batch_ids:
-                            self.storage.update_summary_parent(child_id, parent_id)
+                        self.storage.update_summary_parents(batch_ids, parent_id)
                     results["success"] += 1
                     logger.debug("Created level-%d summary %d", current_level + 1, parent_id)
                 else:
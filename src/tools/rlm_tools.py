@@ -9,6 +9,7 @@ from src.core.storage import StorageEngine
 
 class RLMTools(Toolkit):
     def __init__(self, db_path: str, **kwargs):
+        self._db_path = db_path
         self.storage = StorageEngine(db_path)
         tools = [
             self.inspect_document_hierarchy,
@@ -29,6 +30,17 @@ class RLMTools(Toolkit):
         else:
             self._chunk_rotator = None
 
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
+    @db_path.setter
+    def db_path(self, db_path: str) -> None:
+        """Points the toolkit at a different content DB (lets agents be reused across DBs)."""
+        if db_path != self._db_path:
+            self._db_path = db_path
+            self.storage = StorageEngine(db_path)
+
     def inspect_document_hierarchy(self) -> str:
         """
         Returns the top-level (root) summaries to give an overview of the document structure.
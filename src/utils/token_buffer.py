@@ -1,4 +1,6 @@
 import logging
+from itertools import accumulate
+from typing import List
 
 import tiktoken
 
@@ -46,3 +48,22 @@ class TokenBuffer:
 
         truncated_tokens = tokens[:max_tokens]
         return self.encoding.decode(truncated_tokens)
+
+    def token_offsets(self, text: str) -> List[int]:
+        """
+        Tokenizes text once and returns the character index where each token
+        starts, followed by len(text) as a final sentinel.
+        """
+        if not text:
+            return [0]
+
+        tokens = self.encoding.encode(text, allowed_special='all')
+
+        if text.isascii():
+            # One byte per character, so token byte lengths are character lengths
+            token_bytes = self.encoding.decode_tokens_bytes(tokens)
+            return list(accumulate(map(len, token_bytes), initial=0))
+
+        _, offsets = self.encoding.decode_with_offsets(tokens)
+        offsets.append(len(text))
+        return offsets
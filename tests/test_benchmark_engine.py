@@ -0,0 +1,240 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from benchmarks import base
+from benchmarks.base import BenchmarkEngine, BenchmarkLogic, _dumps_line
+from src.core.storage import SCHEMA_VERSION
+
+# Kept before BenchmarkEngineTestCase patches it out
+_real_ingest_context = BenchmarkEngine._ingest_context
+
+
+class _Logic(BenchmarkLogic):
+    """Six items over three distinct contexts; item 2 has an empty context."""
+
+    def load_data(self, subset, limit=None):
+        data = [
+            {"question": f"q{i}", "context": f"ctx{i % 3}" if i != 2 else "", "answer": "A"}
+            for i in range(6)
+        ]
+        return data[:limit] if limit else data
+
+    def get_context(self, item):
+        return item["context"]
+
+    def create_prompt(self, item):
+        return item["question"]
+
+    def evaluate(self, agent_response, item):
+        return agent_response.endswith("A"), "A"
+
+
+class BenchmarkEngineTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        results_patch = patch.object(base, "RESULTS_DIR", self.tmp)
+        results_patch.start()
+        self.addCleanup(results_patch.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+        self.ingested = []
+
+        def fake_ingest(engine, context, db_path):
+            self.ingested.append(os.path.basename(db_path))
+            Path(db_path).write_text(context)
+
+        ingest_patch = patch.object(BenchmarkEngine, "_ingest_context", fake_ingest)
+        ingest_patch.start()
+        self.addCleanup(ingest_patch.stop)
+
+        factory_patch = patch.object(base, "AgentFactory")
+        self.mock_factory = factory_patch.start()
+        self.addCleanup(factory_patch.stop)
+        agent = MagicMock()
+        agent.run.return_value.content = "ANSWER: A"
+        self.mock_factory.create_agent.return_value = agent
+
+    def make_engine(self) -> BenchmarkEngine:
+        return BenchmarkEngine("t", "s", _Logic(), db_output_dir=str(self.tmp / "dbs"))
+
+
+class TestDbNaming(BenchmarkEngineTestCase):
+    def test_items_sharing_context_share_a_db(self):
+        self.make_engine().run()
+
+        # Three distinct non-empty contexts -> three ingestions
+        self.assertEqual(len(self.ingested), 3)
+        self.assertTrue(all(name.startswith("ctx_") for name in self.ingested))
+
+    def test_legacy_db_name_is_kept(self):
+        engine = self.make_engine()
+        engine._existing_dbs = {"q_1.db"}
+
+        self.assertEqual(engine._db_filename(1, "ctx1"), "q_1.db")
+        self.assertEqual(engine._db_filename(4, "ctx1"), engine._db_filename(7, "ctx1"))
+        self.assertNotEqual(engine._db_filename(4, "ctx1"), engine._db_filename(4, "ctx2"))
+
+    def test_context_hashed_once_per_item(self):
+        with patch.object(base.hashlib, "sha256", wraps=hashlib.sha256) as mock_sha:
+            self.make_engine().run()
+
+        # Five items have a context; the empty one is never hashed
+        self.assertEqual(mock_sha.call_count, 5)
+
+    def test_db_named_by_context_hash(self):
+        engine = self.make_engine()
+        digest = hashlib.sha256("ctx1".encode("utf-8")).hexdigest()[:16]
+
+        self.assertEqual(engine._db_filename(1, "ctx1"), f"ctx_{digest}.db")
+        self.assertEqual(engine._item_db_filename(1, {"context": "ctx1"}), f"ctx_{digest}.db")
+        self.assertIsNone(engine._item_db_filename(2, {"context": ""}))
+
+
+class TestScanResults(BenchmarkEngineTestCase):
+    def _record(self, index, is_correct, **fields):
+        record = {
+            "index": index,
+            "dataset": "t",
+            "subset": "s",
+            "question": f"q{index}",
+            "agent_response": "ANSWER: A",
+            "expected_answer": "A",
+            "is_correct": is_correct,
+        }
+        record.update(fields)
+        return record
+
+    def test_missing_and_empty_file(self):
+        engine = self.make_engine()
+        self.assertEqual(engine._scan_results(), (set(), 0, 0))
+
+        engine.output_file.touch()
+        self.assertEqual(engine._scan_results(), (set(), 0, 0))
+
+    def test_truncated_final_line_is_skipped(self):
+        engine = self.make_engine()
+        complete = _dumps_line(self._record(0, True)) + _dumps_line(self._record(1, False))
+        partial = _dumps_line(self._record(2, True))
+        engine.output_file.write_bytes(complete + partial[: partial.index(b'"is_correct"') + 5])
+
+        self.assertEqual(engine._scan_results(), ({0, 1}, 1, 2))
+
+    def test_escaped_strings_do_not_confuse_the_scan(self):
+        engine = self.make_engine()
+        tricky = 'say "hi"\\n, "is_correct": true, "index": 9'
+        lines = [
+            _dumps_line(self._record(0, False, question=tricky, agent_response=tricky)),
+            _dumps_line(self._record(1, True, agent_response="line\nbreak \u00e9 \\")),
+            # Records not written by _dumps_line go through the JSON fallback
+            (json.dumps({"is_correct": True, "index": 2}) + "\n").encode(),
+            (json.dumps(self._record(3, False, question=tricky), indent=None) + "\n").encode(),
+            b"\n",
+        ]
+        engine.output_file.write_bytes(b"".join(lines))
+
+        self.assertEqual(engine._scan_results(), ({0, 1, 2, 3}, 2, 4))
+
+    def test_resume_skips_processed_items(self):
+        self.make_engine().run(limit=3)
+        # Item 2 has an empty context and is never recorded
+        self.assertEqual(self.make_engine()._scan_results(), ({0, 1}, 2, 2))
+
+        agent = self.mock_factory.create_agent.return_value
+        agent.run.reset_mock()
+        engine = self.make_engine()
+        # The fake DBs from the first run aren't SQLite files
+        with patch.object(BenchmarkEngine, "_validate_existing_db"):
+            engine.run()
+
+        self.assertEqual(agent.run.call_count, 3)
+        self.assertEqual(engine._scan_results(), ({0, 1, 3, 4, 5}, 5, 5))
+
+
+class TestSerialShutdown(BenchmarkEngineTestCase):
+    def test_agent_error_stops_prefetched_ingestion(self):
+        stopped_early = []
+        ctx1_started = threading.Event()
+
+        class SlowIndexer:
+            """Ingests ctx0 at once; blocks on ctx1 until asked to stop."""
+
+            def __init__(self, db_path, max_chunk_tokens):
+                self.db_path = db_path
+
+            def retarget(self, db_path):
+                self.db_path = db_path
+
+            def ingest_text(self, text, source_name, stop=None):
+                Path(self.db_path).write_text(text)
+                if text == "ctx1":
+                    ctx1_started.set()
+                    stopped_early.append(stop.wait(timeout=10))
+
+        def failing_run(prompt):
+            # Fail item 0 only once item 1's ingestion is underway
+            ctx1_started.wait(timeout=10)
+            raise RuntimeError("agent failed")
+
+        agent = self.mock_factory.create_agent.return_value
+        agent.run.side_effect = failing_run
+
+        engine = self.make_engine()
+        with patch.object(BenchmarkEngine, "_ingest_context", _real_ingest_context), patch.object(
+            base, "Indexer", SlowIndexer
+        ):
+            with self.assertRaises(RuntimeError):
+                engine.run()
+
+        self.assertEqual(stopped_early, [True])
+        db_dir = self.tmp / "dbs"
+        self.assertTrue((db_dir / engine._db_filename(0, "ctx0")).exists())
+        # The interrupted ingestion leaves no partial DB behind
+        self.assertFalse((db_dir / engine._db_filename(1, "ctx1")).exists())
+        self.assertIsNone(engine._ingest_stop)
+
+
+class TestValidationSentinel(BenchmarkEngineTestCase):
+    def setUp(self):
+        super().setUp()
+        self.db_path = str(self.tmp / "ctx_0.db")
+        Path(self.db_path).write_bytes(b"db")
+
+    def test_mark_then_validated(self):
+        engine = self.make_engine()
+        self.assertFalse(engine._is_validated(self.db_path))
+
+        engine._mark_validated(self.db_path)
+        self.assertTrue(engine._is_validated(self.db_path))
+
+    def test_stale_after_mtime_change(self):
+        engine = self.make_engine()
+        engine._mark_validated(self.db_path)
+
+        mtime_ns = os.stat(self.db_path).st_mtime_ns + 10**9
+        os.utime(self.db_path, ns=(mtime_ns, mtime_ns))
+
+        self.assertFalse(engine._is_validated(self.db_path))
+
+    def test_stale_after_schema_change(self):
+        engine = self.make_engine()
+        mtime_ns = os.stat(self.db_path).st_mtime_ns
+        Path(self.db_path + ".ok").write_text(f"{SCHEMA_VERSION - 1}\n{mtime_ns}\n")
+
+        self.assertFalse(engine._is_validated(self.db_path))
+
+    def test_corrupt_sentinel(self):
+        engine = self.make_engine()
+        Path(self.db_path + ".ok").write_text("garbage")
+
+        self.assertFalse(engine._is_validated(self.db_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
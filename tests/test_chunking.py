@@ -0,0 +1,57 @@
+import pytest
+import tiktoken
+
+from src.chunking.fixed import FixedTokenChunker
+from src.utils.token_buffer import TokenBuffer
+
+# Byte-level BPE with a few merges, including the first two bytes of é and of
+# the 4-byte emojis, so character and token boundaries often disagree
+_MERGES = [b"th", b"he", b"the", b" the", b"wo", b"rd", b"word", b" word", b"\xc3\xa9", b"\xf0\x9f"]
+_PAT = r"""'s|'t|'re|'ve|'m|'ll|'d| ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+"""
+
+TEXTS = [
+    "the word " * 50,
+    "héllo wörld 😀😀 the word " * 20,
+    "😀" * 30,
+]
+
+
+@pytest.fixture(scope="module")
+def token_buffer():
+    # Built in-process, so these tests don't need to download an encoding
+    ranks = {bytes([i]): i for i in range(256)}
+    for rank, merge in enumerate(_MERGES, start=256):
+        ranks[merge] = rank
+    tb = TokenBuffer.__new__(TokenBuffer)
+    tb.encoding = tiktoken.Encoding("toy", pat_str=_PAT, mergeable_ranks=ranks, special_tokens={})
+    return tb
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("max_tokens", [1, 3, 17])
+@pytest.mark.parametrize("overlap_ratio", [0, 0.1, 0.5])
+def test_fixed_chunks_never_exceed_max_tokens(token_buffer, text, max_tokens, overlap_ratio):
+    chunker = FixedTokenChunker(max_tokens, token_buffer, overlap_ratio)
+    chunks = list(chunker.chunk_text(text))
+
+    assert chunks[0].start_index == 0
+    assert chunks[-1].end_index == len(text)
+    for prev, nxt in zip(chunks, chunks[1:]):
+        assert prev.start_index < nxt.start_index <= prev.end_index
+    for chunk in chunks:
+        assert chunk.text == text[chunk.start_index:chunk.end_index]
+        # Only a lone character that alone encodes past the limit may exceed it
+        if len(chunk.text) > 1:
+            assert token_buffer.count_tokens(chunk.text) <= max_tokens
+
+
+def test_window_after_multi_token_character(token_buffer):
+    text = "😀" * 30
+    chunker = FixedTokenChunker(3, token_buffer)
+    offsets = token_buffer.token_offsets(text)
+
+    # Each emoji encodes to three tokens sharing one offset, so a 3-token window
+    # holds exactly one emoji
+    end = chunker._window_end(text, offsets, 1)
+    assert token_buffer.count_tokens(text[1:end]) <= 3
+    assert end == 2
@@ -0,0 +1,165 @@
+import marshal
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.config.config import (
+    AgentConfig,
+    AgentConfigLoader,
+    ModelConfig,
+    StorageConfig,
+    _yaml_codec,
+)
+
+AGENTS_YAML = """\
+alpha-agent:
+  instructions:
+  - Be brief.
+  tools:
+  - RLMTools
+  model:
+    provider: openai
+    model_id: gpt-4
+    temperature: 0.0
+beta-agent:
+  instructions: []
+  tools: []
+  temperature: 0.5
+  calls_per_model: 2
+  models:
+  - provider: groq
+    model_id: llama
+  - provider: cerebras
+    model_id: glm
+"""
+
+
+class TestAgentConfigLoader(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "agents.yaml"
+        self.path.write_text(AGENTS_YAML, encoding="utf-8")
+        self.cache_path = Path(str(self.path) + ".mcache")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _rewrite(self, text: str) -> None:
+        """Rewrites the YAML with a guaranteed-new mtime."""
+        old_mtime = os.stat(self.path).st_mtime_ns
+        self.path.write_text(text, encoding="utf-8")
+        os.utime(self.path, ns=(old_mtime + 10**9, old_mtime + 10**9))
+
+    @patch("src.config.config.time.monotonic")
+    def test_stat_ttl_skips_recheck(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        loader = AgentConfigLoader(str(self.path))
+        self.assertIsNotNone(loader.get_agent("alpha-agent"))
+
+        self._rewrite(AGENTS_YAML.replace("alpha-agent", "gamma-agent"))
+
+        # Within the TTL the file is not re-checked
+        mock_monotonic.return_value = 100.5
+        self.assertIsNotNone(loader.get_agent("alpha-agent"))
+
+        mock_monotonic.return_value = 101.5
+        self.assertIsNone(loader.get_agent("alpha-agent"))
+        self.assertIsNotNone(loader.get_agent("gamma-agent"))
+
+    def test_mcache_written_and_reused(self):
+        AgentConfigLoader(str(self.path)).get_all_agents()
+        self.assertTrue(self.cache_path.exists())
+
+        # A cache entry keyed to the current file is trusted over the YAML
+        stat = os.stat(self.path)
+        cached = {"cached-agent": {"instructions": [], "tools": []}}
+        self.cache_path.write_bytes(marshal.dumps(((stat.st_mtime_ns, stat.st_size), cached)))
+
+        loader = AgentConfigLoader(str(self.path))
+        self.assertEqual(list(loader.get_all_agents()), ["cached-agent"])
+
+    def test_mcache_invalidated_when_yaml_changes(self):
+        AgentConfigLoader(str(self.path)).get_all_agents()
+
+        self._rewrite(AGENTS_YAML.replace("alpha-agent", "gamma-agent"))
+
+        loader = AgentConfigLoader(str(self.path))
+        self.assertEqual(list(loader.get_all_agents()), ["gamma-agent", "beta-agent"])
+
+    def test_corrupt_mcache_falls_back_to_yaml(self):
+        self.cache_path.write_bytes(b"not marshal data")
+
+        loader = AgentConfigLoader(str(self.path))
+        self.assertEqual(list(loader.get_all_agents()), ["alpha-agent", "beta-agent"])
+
+    def test_lazy_materialization(self):
+        loader = AgentConfigLoader(str(self.path))
+
+        beta = loader.get_agent("beta-agent")
+        self.assertTrue(beta.has_model_rotation())
+        self.assertEqual(beta.model_pool.calls_per_model, 2)
+        self.assertEqual(beta.model_pool.models[1].temperature, 0.5)
+        # Agents not asked for yet stay unbuilt
+        self.assertIsNone(loader._entries["alpha-agent"][1])
+        self.assertIsNone(loader.get_agent("missing-agent"))
+
+        agents = loader.get_all_agents()
+        self.assertEqual(list(agents), ["alpha-agent", "beta-agent"])
+        self.assertIs(agents["beta-agent"], beta)
+        self.assertEqual(agents["alpha-agent"].model_settings.model_id, "gpt-4")
+
+    @patch("src.config.config.time.monotonic")
+    def test_reload_keeps_unchanged_instances(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        loader = AgentConfigLoader(str(self.path))
+        alpha = loader.get_agent("alpha-agent")
+        beta = loader.get_agent("beta-agent")
+
+        self._rewrite(AGENTS_YAML.replace("temperature: 0.5", "temperature: 0.7"))
+        mock_monotonic.return_value = 200.0
+
+        self.assertIs(loader.get_agent("alpha-agent"), alpha)
+        self.assertIsNot(loader.get_agent("beta-agent"), beta)
+        self.assertEqual(loader.get_agent("beta-agent").model_pool.models[0].temperature, 0.7)
+
+    def test_save_round_trip(self):
+        loader = AgentConfigLoader(str(self.path))
+        loader.get_agent("beta-agent")
+        loader.set_agent(
+            AgentConfig(
+                agent_id="delta-agent",
+                instructions=["New."],
+                tools=[],
+                model_settings=ModelConfig(provider="openai", model_id="gpt-4o", temperature=0.2),
+                storage_settings=StorageConfig(db_path="data/d.db", session_table="d_sessions"),
+            )
+        )
+        loader.remove_agent("alpha-agent")
+        loader.save()
+
+        expected = {
+            agent_id: AgentConfigLoader._agent_to_dict(config)
+            for agent_id, config in loader.get_all_agents().items()
+        }
+        yaml, _, dumper = _yaml_codec()
+        written = self.path.read_text(encoding="utf-8")
+        self.assertEqual(written, yaml.dump(expected, Dumper=dumper, sort_keys=False))
+
+        reloaded = AgentConfigLoader(str(self.path)).get_all_agents()
+        self.assertEqual(dict(reloaded), dict(loader.get_all_agents()))
+        self.assertEqual(list(reloaded), ["beta-agent", "delta-agent"])
+
+        # Saving again without edits reproduces the file exactly
+        loader.save()
+        self.assertEqual(self.path.read_text(encoding="utf-8"), written)
+
+    def test_remove_unknown_agent_raises(self):
+        loader = AgentConfigLoader(str(self.path))
+        with self.assertRaises(KeyError):
+            loader.remove_agent("missing-agent")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,14 +2,18 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 from src.config.config import AgentConfig, ModelConfig, StorageConfig
-from src.core.factory import AgentFactory
+from src.core.factory import AgentFactory, ModelRotator
 
 
 class TestAgentFactory(unittest.TestCase):
     def setUp(self):
         AgentFactory._wrapper_cache = {}
+        AgentFactory._tool_cache = {}
+        AgentFactory._db_cache = {}
+        AgentFactory._static_kwargs_cache = {}
+        AgentFactory._tool_resolution_cache = {}
 
-    @patch("src.core.factory.MultiProviderWrapper")
+    @patch("keycycle.MultiProviderWrapper")
     def test_get_cached_wrapper(self, MockWrapper):
         mock_instance = MagicMock()
         MockWrapper.from_env.return_value = mock_instance
@@ -54,12 +58,33 @@ class TestAgentFactory(unittest.TestCase):
         mock_rlm_tool_cls.assert_called_with(db_path=db_path)
         mock_python_tool_cls.assert_called_with()
 
+        # The name list is resolved against the registry only once
+        AgentFactory._hydrate_tools(tool_names, db_path)
+        self.assertEqual(mock_registry.get.call_count, 3)
+
+    @patch("src.core.factory.TOOL_REGISTRY")
+    def test_hydrate_tools_shares_stateless_tools(self, mock_registry):
+        mock_rlm_tool_cls = MagicMock(side_effect=lambda db_path: MagicMock())
+        mock_python_tool_cls = MagicMock(side_effect=lambda: MagicMock())
+        mock_registry.get.side_effect = lambda name: {
+            "RLMTools": mock_rlm_tool_cls,
+            "PythonTools": mock_python_tool_cls,
+        }.get(name)
+
+        tools1 = AgentFactory._hydrate_tools(["RLMTools", "PythonTools"], "/tmp/a.db")
+        tools2 = AgentFactory._hydrate_tools(["RLMTools", "PythonTools"], "/tmp/a.db")
+
+        mock_python_tool_cls.assert_called_once_with()
+        self.assertIs(tools1[1], tools2[1])
+        self.assertEqual(mock_rlm_tool_cls.call_count, 2)
+        self.assertIsNot(tools1[0], tools2[0])
+
     @patch("src.core.factory.CONFIG")
     @patch("src.core.factory.AgentFactory.create_model")
     @patch("src.core.factory.AgentFactory._hydrate_tools")
-    @patch("src.core.factory.SqliteDb")
-    @patch("src.core.factory.setup_tracing")
-    @patch("src.core.factory.Agent")
+    @patch("agno.db.sqlite.SqliteDb")
+    @patch("agno.tracing.setup_tracing")
+    @patch("agno.agent.Agent")
     def test_create_agent(
         self,
         MockAgent,
@@ -108,7 +133,12 @@ class TestAgentFactory(unittest.TestCase):
         MockSqliteDb.assert_called()
         mock_setup_tracing.assert_called_with(db=mock_db, batch_processing=True)
 
-        MockAgent.assert_called_once()
+        AgentFactory.create_agent(agent_id)
+        MockSqliteDb.assert_called_once()
+        mock_setup_tracing.assert_called_once()
+        self.assertIs(MockAgent.call_args[1]["db"], mock_db)
+
+        self.assertEqual(MockAgent.call_count, 2)
         call_kwargs = MockAgent.call_args[1]
         self.assertEqual(call_kwargs["id"], agent_id)
         self.assertEqual(call_kwargs["model"], mock_model)
@@ -118,6 +148,38 @@ class TestAgentFactory(unittest.TestCase):
         self.assertTrue(call_kwargs["read_chat_history"])
         self.assertTrue(call_kwargs["markdown"])
 
+    @patch("src.tools.rlm_tools.StorageEngine")
+    @patch("src.tools.rlm_tools.CONFIG")
+    def test_rebind(self, mock_config, MockStorageEngine):
+        from src.tools.rlm_tools import RLMTools
+
+        mock_config.get_agent.return_value = None
+        rlm_tools = RLMTools(db_path="/tmp/a.db")
+        agent = MagicMock()
+        agent.tools = [MagicMock(), rlm_tools]
+
+        AgentFactory.rebind(agent, content_db_path="/tmp/b.db", session_id="s2")
+
+        self.assertEqual(rlm_tools.db_path, "/tmp/b.db")
+        MockStorageEngine.assert_called_with("/tmp/b.db")
+        self.assertEqual(agent.session_id, "s2")
+
+
+class TestModelRotator(unittest.TestCase):
+    def test_rotation_and_force_rotate(self):
+        configs = [
+            ModelConfig(provider="p", model_id=str(i), temperature=0.0) for i in range(3)
+        ]
+        rotator = ModelRotator(configs, calls_per_model=2)
+
+        picked = [rotator.get_next_config().model_id for _ in range(7)]
+        self.assertEqual(picked, ["0", "0", "1", "1", "2", "2", "0"])
+
+        # One call into model 0; forcing moves to model 1 with a fresh count
+        rotator.force_rotate()
+        picked = [rotator.get_next_config().model_id for _ in range(3)]
+        self.assertEqual(picked, ["1", "1", "2"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import threading
 import unittest
 from unittest.mock import MagicMock, mock_open, patch
 
@@ -75,6 +76,90 @@ class TestIndexer(unittest.TestCase):
             indexer.ingest_file("directory/")
         self.assertIn("not a file", str(context.exception))
 
+    @patch("src.core.indexer.AgentFactory")
+    @patch("src.core.indexer.StorageEngine")
+    @patch("src.core.indexer.FixedTokenChunker")
+    @patch("src.core.indexer.TokenBuffer")
+    def test_ingest_text_empty(
+        self, MockTokenBuffer, MockChunker, MockStorageEngine, MockAgentFactory
+    ):
+        indexer = Indexer(db_path=":memory:")
+        with patch.object(indexer, "_process_chunks_parallel") as mock_process:
+            indexer.ingest_text("   \n")
+        mock_process.assert_not_called()
+
+    @patch("src.core.indexer.AgentFactory")
+    @patch("src.core.indexer.StorageEngine")
+    @patch("src.core.indexer.FixedTokenChunker")
+    @patch("src.core.indexer.TokenBuffer")
+    def test_ingest_text_builds_hierarchy(
+        self, MockTokenBuffer, MockChunker, MockStorageEngine, MockAgentFactory
+    ):
+        indexer = Indexer(db_path=":memory:")
+        with patch.object(
+            indexer, "_process_chunks_parallel", return_value=[1, 2, 3]
+        ) as mock_process, patch.object(indexer, "_build_hierarchy_parallel") as mock_build:
+            indexer.ingest_text("some context", source_name="q_0.db")
+
+        mock_process.assert_called_once_with("some context", "q_0.db")
+        mock_build.assert_called_once_with([1, 2, 3], group_size=5, max_depth=1)
+
+    @patch("src.core.indexer.AgentFactory")
+    @patch("src.core.indexer.StorageEngine")
+    @patch("src.core.indexer.FixedTokenChunker")
+    @patch("src.core.indexer.TokenBuffer")
+    def test_ingest_text_stopped_skips_hierarchy(
+        self, MockTokenBuffer, MockChunker, MockStorageEngine, MockAgentFactory
+    ):
+        indexer = Indexer(db_path=":memory:")
+        stop = threading.Event()
+        stop.set()
+        with patch.object(
+            indexer, "_process_chunks_parallel", return_value=[1, 2, 3]
+        ), patch.object(indexer, "_build_hierarchy_parallel") as mock_build:
+            indexer.ingest_text("some context", source_name="q_0.db", stop=stop)
+
+        mock_build.assert_not_called()
+        self.assertIsNone(indexer._stop)
+
+    @patch("src.core.indexer.AgentFactory")
+    @patch("src.core.indexer.StorageEngine")
+    @patch("src.core.indexer.FixedTokenChunker")
+    @patch("src.core.indexer.TokenBuffer")
+    def test_summarize_all_skips_calls_after_stop(
+        self, MockTokenBuffer, MockChunker, MockStorageEngine, MockAgentFactory
+    ):
+        indexer = Indexer(db_path=":memory:", num_keys=1)
+        indexer._stop = threading.Event()
+
+        def summarize(prompt):
+            indexer._stop.set()
+            return f"summary of {prompt}"
+
+        with patch.object(indexer, "_get_summary_from_llm", side_effect=summarize) as mock_llm:
+            summaries = list(indexer._summarize_all(["a", "b", "c"]))
+
+        # The call in flight when the stop was requested still lands
+        self.assertEqual(summaries, ["summary of a"])
+        mock_llm.assert_called_once_with("a")
+
+    @patch("src.core.indexer.AgentFactory")
+    @patch("src.core.indexer.StorageEngine")
+    @patch("src.core.indexer.FixedTokenChunker")
+    @patch("src.core.indexer.TokenBuffer")
+    def test_retarget(
+        self, MockTokenBuffer, MockChunker, MockStorageEngine, MockAgentFactory
+    ):
+        indexer = Indexer(db_path="a.db")
+        chunker = indexer.chunker
+
+        indexer.retarget("b.db")
+
+        self.assertEqual(indexer.db_path, "b.db")
+        MockStorageEngine.assert_called_with("b.db")
+        self.assertIs(indexer.chunker, chunker)
+        MockTokenBuffer.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from benchmarks.longbenchv2 import LongBenchLogic
+
+ITEM = {"answer": "b"}
+
+
+class TestLongBenchEvaluate(unittest.TestCase):
+    def setUp(self):
+        self.logic = LongBenchLogic()
+
+    def assertPrediction(self, response: str, is_correct: bool) -> None:
+        self.assertEqual(self.logic.evaluate(response, ITEM), (is_correct, "B"), response[:80])
+
+    def test_explicit_answer(self):
+        self.assertPrediction("After searching the index.\nANSWER: B", True)
+        self.assertPrediction("answer b", True)
+        self.assertPrediction("ANSWER: C", False)
+
+    def test_answer_followed_by_long_explanation(self):
+        explanation = "\nReasoning: " + "the context supports this choice. " * 40
+        self.assertGreater(len(explanation), 512)
+        self.assertPrediction("ANSWER: B" + explanation, True)
+
+    def test_answer_straddling_tail_boundary(self):
+        response = "ANSWER: B" + "x" * 507
+        self.assertPrediction(response, True)
+
+    def test_first_answer_wins(self):
+        self.assertPrediction("ANSWER: B, though one might argue ANSWER: C", True)
+
+    def test_answer_pattern_beats_fallback(self):
+        self.assertPrediction("Option A looked tempting, but ANSWER: B", True)
+
+    def test_option_and_choice_fallbacks(self):
+        self.assertPrediction("The correct option is option B.", True)
+        self.assertPrediction("I pick choice b", True)
+        self.assertPrediction("OPTION D", False)
+
+    def test_single_letter(self):
+        self.assertPrediction("  b\n", True)
+        self.assertPrediction("A", False)
+
+    def test_no_answer(self):
+        self.assertPrediction("I could not find it in the context.", False)
+        self.assertPrediction("", False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import ast
+import pickle
+import random
+import unittest
+import warnings
+
+import pyarrow as pa
+
+from benchmarks.oolong import _ROW_CACHE_SIZE, _TableRows, _parse_oolong_answer
+
+
+def _make_table(n: int) -> pa.Table:
+    return pa.table(
+        {
+            "context_window_text": [f"context {i}" for i in range(n)],
+            "question": [f"question {i}" for i in range(n)],
+            "answer": ["['yes']"] * n,
+        }
+    )
+
+
+class TestTableRows(unittest.TestCase):
+    def test_repeated_lookups_share_one_row(self):
+        rows = _TableRows(_make_table(10))
+
+        row = rows[3]
+        self.assertEqual(row["context_window_text"], "context 3")
+        self.assertIs(rows[3], row)
+        self.assertIs(rows[-7], row)
+
+    def test_row_cache_is_bounded(self):
+        rows = _TableRows(_make_table(10))
+        first = rows[0]
+
+        for i in range(1, _ROW_CACHE_SIZE + 1):
+            rows[i]
+
+        self.assertEqual(len(rows._rows), _ROW_CACHE_SIZE)
+        self.assertIsNot(rows[0], first)
+        self.assertEqual(rows[0]["question"], "question 0")
+
+    def test_index_out_of_range(self):
+        rows = _TableRows(_make_table(2))
+        with self.assertRaises(IndexError):
+            rows[2]
+
+    def test_row_pickles_as_dict(self):
+        rows = _TableRows(_make_table(2))
+        self.assertEqual(
+            pickle.loads(pickle.dumps(rows[1])),
+            {"context_window_text": "context 1", "question": "question 1", "answer": "['yes']"},
+        )
+
+
+def _literal_eval_answer(raw_ans: str) -> str:
+    """The plain ast.literal_eval normalization the fast path must match."""
+    try:
+        answers = ast.literal_eval(raw_ans)
+        if isinstance(answers, list) and answers:
+            return str(answers[0]).lower().strip()
+        return str(raw_ans).lower().strip()
+    except (ValueError, SyntaxError):
+        return str(raw_ans).lower().strip()
+
+
+class TestParseOolongAnswer(unittest.TestCase):
+    CASES = [
+        "['Correct']",
+        '["Correct"]',
+        "[' spaced ']",
+        "['']",
+        "['a', 'b']",
+        "['a, b']",
+        "['it\\'s']",
+        "['a\\nb']",
+        "['a\nb']",
+        "['a' 'b']",
+        "['a', 'b')]",
+        "[ 'a' ]",
+        "[1, 2]",
+        "[]",
+        "['x'][0]",
+        "([1])",
+        " ['a']",
+        "\u2028['a']",
+        "[\"it's\"]",
+        "['\x00']",
+        "plain answer",
+        "'quoted'",
+        "",
+    ]
+
+    def assertParity(self, raw_ans: str) -> None:
+        _parse_oolong_answer.cache_clear()
+        self.assertEqual(_parse_oolong_answer(raw_ans), _literal_eval_answer(raw_ans), repr(raw_ans))
+
+    def test_matches_literal_eval(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", SyntaxWarning)
+            for raw_ans in self.CASES:
+                self.assertParity(raw_ans)
+
+    def test_matches_literal_eval_on_random_input(self):
+        rng = random.Random(0)
+        alphabet = ["a", "B", "é", "1", " ", "\t", "\n", "\x00", "\u2028", "'", '"', ",", "[", "]", "\\"]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", SyntaxWarning)
+            for _ in range(2000):
+                body = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+                for raw_ans in (body, f"[{body}]", f"['{body}']", f'["{body}"]'):
+                    self.assertParity(raw_ans)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.storage import SCHEMA_VERSION, StorageEngine
+
+# The layout of DBs written before the schema version stamp existed
+CURRENT_LAYOUT = """
+CREATE TABLE chunks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    text TEXT, start_index INTEGER, end_index INTEGER, file_source TEXT
+);
+CREATE TABLE summaries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    summary_text TEXT, level INTEGER, parent_id INTEGER, sequence_index INTEGER, chunk_id INTEGER
+);
+CREATE INDEX idx_parent_seq ON summaries(parent_id, sequence_index);
+CREATE INDEX idx_level ON summaries(level);
+CREATE INDEX idx_chunk_id ON summaries(chunk_id);
+INSERT INTO chunks (text, start_index, end_index, file_source) VALUES ('hello', 0, 5, 'f');
+INSERT INTO summaries (summary_text, level, parent_id, sequence_index, chunk_id)
+    VALUES ('root', 0, NULL, 0, 1);
+"""
+
+OLD_LAYOUT = """
+CREATE TABLE chunks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    text TEXT, start_index INTEGER, end_index INTEGER, file_source TEXT
+);
+CREATE TABLE summaries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    summary_text TEXT, level INTEGER, parent_id INTEGER, sequence_index INTEGER
+);
+CREATE TABLE summary_chunks (summary_id INTEGER, chunk_id INTEGER);
+INSERT INTO chunks (text, start_index, end_index, file_source) VALUES ('hello', 0, 5, 'f');
+INSERT INTO summaries (summary_text, level, parent_id, sequence_index) VALUES ('root', 0, NULL, 0);
+INSERT INTO summary_chunks VALUES (1, 1);
+"""
+
+
+class TestStorageInit(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.db_path = str(Path(self._tmp.name) / "q_0.db")
+
+    def _make_db(self, script: str) -> None:
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(script)
+        conn.close()
+
+    def _pragma(self, name: str):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(f"PRAGMA {name}").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_new_db_is_stamped_and_uses_wal(self):
+        StorageEngine(self.db_path)
+
+        self.assertEqual(self._pragma("user_version"), SCHEMA_VERSION)
+        self.assertEqual(self._pragma("journal_mode"), "wal")
+
+    def test_current_unstamped_db_is_left_untouched(self):
+        self._make_db(CURRENT_LAYOUT)
+        before = Path(self.db_path).read_bytes()
+
+        storage = StorageEngine(self.db_path)
+        self.assertEqual(storage.get_root_summaries(), [(1, "root")])
+
+        self.assertEqual(Path(self.db_path).read_bytes(), before)
+        self.assertEqual(self._pragma("journal_mode"), "delete")
+        self.assertFalse(Path(self.db_path + "-wal").exists())
+
+    def test_old_db_is_migrated_and_stamped(self):
+        self._make_db(OLD_LAYOUT)
+
+        storage = StorageEngine(self.db_path)
+
+        self.assertEqual(storage.get_linked_chunk_id(1), 1)
+        self.assertEqual(self._pragma("user_version"), SCHEMA_VERSION)
+        self.assertEqual(self._pragma("journal_mode"), "wal")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -55,3 +55,18 @@ def test_token_buffer_get_chunk_at_none():
     tb = TokenBuffer()
     chunk = tb.get_chunk_at(100, text=None)
     assert chunk == ""
+
+
+def test_token_buffer_token_offsets():
+    tb = TokenBuffer()
+    text = "Hello world, héllo wörld"
+    offsets = tb.token_offsets(text)
+    assert offsets[0] == 0
+    assert offsets[-1] == len(text)
+    assert offsets == sorted(offsets)
+    assert len(offsets) == tb.count_tokens(text) + 1
+
+
+def test_token_buffer_token_offsets_empty():
+    tb = TokenBuffer()
+    assert tb.token_offsets("") == [0]